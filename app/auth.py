@@ -0,0 +1,67 @@
+import os
+from dataclasses import dataclass
+from fastapi import Request, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.cache import LRUCache
+from app.db import get_db
+from app.loaders import get_user_loader
+
+AUTH_USER_CACHE_SIZE = int(os.getenv("AUTH_USER_CACHE_SIZE", "10000"))
+AUTH_USER_CACHE_TTL_SEC = float(os.getenv("AUTH_USER_CACHE_TTL_SEC", "10"))
+
+
+@dataclass(slots=True)
+class AuthUser:
+    user_id: int
+    nickname: str
+    profile_image: str | None
+
+
+class ActiveUserCache:
+    # 존재하는 사용자의 id / 닉네임 / 프로필 이미지를 짧은 TTL 로 들고 있어서
+    # 쓰기 요청마다 "세션 사용자가 아직 있는지" 확인하는 조회를 줄인다.
+    # 프로필 변경과 탈퇴 때 직접 지우고, 다른 워커에서의 변경은 TTL 이 지나면 반영된다.
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = LRUCache(maxsize, ttl)
+
+    def get(self, user_id: int) -> AuthUser | None:
+        return self._cache.get(user_id)
+
+    def set(self, user: AuthUser):
+        self._cache.set(user.user_id, user)
+
+    def invalidate(self, user_id: int):
+        self._cache.delete(user_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+active_users = ActiveUserCache(AUTH_USER_CACHE_SIZE, AUTH_USER_CACHE_TTL_SEC)
+
+
+async def get_active_user(db: AsyncSession, user_id: int) -> AuthUser | None:
+    user = active_users.get(user_id)
+    if user is None:
+        row = await get_user_loader(db).load(user_id)
+        if row is None:
+            return None
+        user = AuthUser(row.user_id, row.nickname, row.profile_image)
+        active_users.set(user)
+    return user
+
+
+async def current_user(request: Request, db: AsyncSession = Depends(get_db)) -> AuthUser | None:
+    # 세션의 로그인 사용자. 로그인하지 않았거나 이미 탈퇴한 사용자면 None.
+    # 401/403 판단 순서는 엔드포인트마다 달라서 여기서 예외를 던지지 않고 컨트롤러에 맡긴다.
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return None
+    return await get_active_user(db, user_id)
+
+
+async def resolve_user(db: AsyncSession, user_id: int, me: AuthUser | None) -> AuthUser | None:
+    # 요청 본문/경로의 user_id 가 존재하는지 확인한다. 보통은 세션 사용자 본인이라 조회 없이 끝난다.
+    if me is not None and me.user_id == user_id:
+        return me
+    return await get_active_user(db, user_id)
@@ -0,0 +1,56 @@
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    # 최대 maxsize 개까지만 들고 있고, 넘치면 가장 오래 안 쓴 항목부터 버린다.
+    # ttl(초)을 주면 그 시간이 지난 항목은 없는 것으로 본다.
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def peek(self, key, default=None):
+        # 통계나 LRU 순서에 영향을 주지 않고 조회 (캐시 내용 갱신용)
+        item = self._data.get(key)
+        return default if item is None else item[1]
+
+    def delete(self, key):
+        self._data.pop(key, None)
+
+    def clear(self):
+        self._data.clear()
+
+    def items(self):
+        return [(key, value) for key, (_, value) in self._data.items()]
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self):
+        return len(self._data)
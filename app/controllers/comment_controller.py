@@ -1,11 +1,67 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from ..responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import traceback
 from . import __init__ as _
-from ..models import user_model, post_model, comment_model
+from ..models import post_model, comment_model
+from ..loaders import get_user_loader
+from ..auth import AuthUser, resolve_user
+from ..detail_cache import post_detail_cache
+from ..feed_window import feed_window
+from ..schemas.comment_schema import CommentItem, CommentList, CommentListResponse
+
+COMMENTS_PAGE_SIZE = 20
+MAX_COMMENTS_PAGE_SIZE = 100
+
+
+async def get_comment_page(db: AsyncSession, post_id: int, after: int, limit: int, extra_user_ids=()):
+    # 상세 조회와 댓글 목록 API 가 같이 쓴다. extra_user_ids 는 작성자 조회를 같은 IN 쿼리에 합치기 위함.
+    comments, has_more = await comment_model.get_comment_page(db, post_id, after, limit)
+
+    loader = get_user_loader(db)
+    loader.prime(*extra_user_ids)
+    authors = await loader.load_many([c.user_id for c in comments])
+
+    items = [
+        CommentItem(
+            c.comment_id,
+            c.content,
+            authors[c.user_id].nickname,
+            authors[c.user_id].profile_image,
+            c.created_at,
+            c.user_id,
+        )
+        for c in comments
+    ]
+    next_cursor = comments[-1].comment_id if comments else after
+    return items, next_cursor, has_more
+
 
-async def create_comment(request: Request, db: AsyncSession):
+async def list_comments(post_id: int, after: int, limit: int, request: Request, db: AsyncSession):
+    if post_id < 0 or after < 0 or limit <= 0:
+        raise HTTPException(status_code=400, detail="invalid_comments_list_request")
+    try:
+        session_user_id = request.session.get("user_id")
+        if not session_user_id:
+            raise HTTPException(status_code=401, detail="unauthorized_user")
+
+        limit = min(limit, MAX_COMMENTS_PAGE_SIZE)
+        items, next_cursor, has_more = await get_comment_page(db, post_id, after, limit)
+        if not items and not await post_model.get_post_by_id(db, post_id):
+            raise HTTPException(status_code=404, detail="post_not_found")
+
+        return ORJSONResponse(
+            status_code=200,
+            content=CommentListResponse("comments_list_success", CommentList(items, next_cursor, has_more)),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("[comments-list] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+async def create_comment(request: Request, db: AsyncSession, me: AuthUser | None):
     try:
         body = await request.json()
     except Exception:
@@ -19,7 +75,7 @@ async def create_comment(request: Request, db: AsyncSession):
             raise HTTPException(status_code=400, detail="invalid_comment_create_request")
         
         post = await post_model.get_post_by_id(db, post_id)
-        user = await user_model.get_user_by_id(db, user_id)
+        user = await resolve_user(db, user_id, me)
         if not post or not user:
             raise HTTPException(status_code=400, detail="invalid_comment_create_request")
 
@@ -30,14 +86,15 @@ async def create_comment(request: Request, db: AsyncSession):
         if user_id != session_user_id:
             raise HTTPException(status_code=400, detail="invalid_comment_create_request")
 
-        comment = await comment_model.create_comment(db, post_id, user_id, content)
-        post = await post_model.update_comments_count(db, post, 1)
+        comment, comments_count = await comment_model.create_comment(db, post_id, user_id, content)
+        post_detail_cache.invalidate(post_id)
+        feed_window.set_comments_count(post_id, comments_count)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "detail": "comment_create_success",
-                "data": {"comment_id": comment.comment_id},
+                "data": {"comment_id": comment.comment_id, "comments_count": comments_count},
             },
         )
     except HTTPException:
@@ -70,8 +127,9 @@ async def update_comment(comment_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         comment = await comment_model.update_comment(db, comment, content)
+        post_detail_cache.invalidate(comment.post_id)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "detail": "comment_update_success",
@@ -105,10 +163,14 @@ async def delete_comment(comment_id: int, request: Request, db: AsyncSession):
         if comment.user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
 
-        await comment_model.delete_comment(db, comment_id)
-        post = await post_model.update_comments_count(db, post, -1)
+        comments_count = await comment_model.delete_comment(db, comment_id, post.post_id)
+        post_detail_cache.invalidate(post.post_id)
+        feed_window.set_comments_count(post.post_id, comments_count)
 
-        return JSONResponse(status_code=200, content={"detail": "comment_delete_success"})
+        return ORJSONResponse(
+            status_code=200,
+            content={"detail": "comment_delete_success", "data": {"comments_count": comments_count}},
+        )
     except HTTPException:
         raise
     except Exception as e:
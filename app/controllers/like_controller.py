@@ -1,9 +1,11 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from ..responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import traceback
 from . import __init__ as _
-from ..models import user_model, post_model, like_model
+from ..models import like_model
+from ..detail_cache import post_detail_cache
+from ..feed_window import feed_window
 
 
 async def create_like(request: Request, db: AsyncSession):
@@ -18,11 +20,6 @@ async def create_like(request: Request, db: AsyncSession):
         if not post_id or not user_id:
             raise HTTPException(status_code=400, detail="invalid_like_create_request")
 
-        post = await post_model.get_post_by_id(db, post_id)
-        user = await user_model.get_user_by_id(db, user_id)
-        if not post or not user:
-            raise HTTPException(status_code=400, detail="invalid_like_create_request")
-
         session_user_id = request.session.get("user_id")
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
@@ -30,19 +27,18 @@ async def create_like(request: Request, db: AsyncSession):
         if session_user_id != user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
 
-        like_for_me = await like_model.get_my_like(db, post_id, session_user_id)
-
-        if like_for_me:
+        # 게시글이 없거나 이미 좋아요를 누른 경우 행이 추가되지 않는다
+        like_id, created, likes = await like_model.like_post(db, post_id, user_id)
+        if not created:
             raise HTTPException(status_code=400, detail="invalid_like_create_request")
-        
-        like = await like_model.create_like(db, post_id, user_id)
-        post = await post_model.update_likes(db, post, 1)
+        post_detail_cache.set_likes(post_id, likes)
+        feed_window.set_likes(post_id, likes)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "detail": "like_create_success",
-                "data": {"like_id": like.like_id},
+                "data": {"like_id": like_id, "likes": likes},
             },
         )
     except HTTPException:
@@ -60,10 +56,6 @@ async def delete_like(like_id: int, request: Request, db: AsyncSession):
         like = await like_model.get_like_by_id(db, like_id)
         if not like:
             raise HTTPException(status_code=404, detail="like_not_found")
-        
-        post = await post_model.get_post_by_id(db, like.post_id)
-        if not post:
-            raise HTTPException(status_code=400, detail="invalid_like_delete_request")
 
         session_user_id = request.session.get("user_id")
         if not session_user_id:
@@ -72,13 +64,73 @@ async def delete_like(like_id: int, request: Request, db: AsyncSession):
         if like.user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
 
-        await like_model.delete_like(db, like_id)
-        post = await post_model.update_likes(db, post, -1)
+        _, likes = await like_model.unlike_post(db, like.post_id, like.user_id)
+        post_detail_cache.set_likes(like.post_id, likes)
+        feed_window.set_likes(like.post_id, likes)
 
-        return JSONResponse(status_code=200, content={"detail": "like_delete_success"})
+        return ORJSONResponse(status_code=200, content={"detail": "like_delete_success", "data": {"likes": likes}})
     except HTTPException:
         raise
     except Exception as e:
         print("[delete-like] unexpected error:", repr(e))
         traceback.print_exc()
         raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def like_post(post_id: int, request: Request, db: AsyncSession):
+    # 멱등 API: 이미 눌려 있어도 성공으로 응답하고 좋아요 수는 바뀌지 않는다
+    if post_id < 0:
+        raise HTTPException(status_code=400, detail="invalid_like_request")
+    try:
+        session_user_id = request.session.get("user_id")
+        if not session_user_id:
+            raise HTTPException(status_code=401, detail="unauthorized_user")
+
+        like_id, created, likes = await like_model.like_post(db, post_id, session_user_id)
+        if like_id is None:
+            raise HTTPException(status_code=404, detail="post_not_found")
+        post_detail_cache.set_likes(post_id, likes)
+        feed_window.set_likes(post_id, likes)
+
+        return ORJSONResponse(
+            status_code=201 if created else 200,
+            content={
+                "detail": "like_success",
+                "data": {"like_id": like_id, "is_liked_by_me": True, "likes": likes},
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("[like-post] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
+
+
+async def unlike_post(post_id: int, request: Request, db: AsyncSession):
+    if post_id < 0:
+        raise HTTPException(status_code=400, detail="invalid_unlike_request")
+    try:
+        session_user_id = request.session.get("user_id")
+        if not session_user_id:
+            raise HTTPException(status_code=401, detail="unauthorized_user")
+
+        _, likes = await like_model.unlike_post(db, post_id, session_user_id)
+        if likes is None:
+            raise HTTPException(status_code=404, detail="post_not_found")
+        post_detail_cache.set_likes(post_id, likes)
+        feed_window.set_likes(post_id, likes)
+
+        return ORJSONResponse(
+            status_code=200,
+            content={
+                "detail": "unlike_success",
+                "data": {"like_id": None, "is_liked_by_me": False, "likes": likes},
+            },
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        print("[unlike-post] unexpected error:", repr(e))
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="internal_server_error")
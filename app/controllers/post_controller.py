@@ -1,46 +1,104 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from ..responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 import traceback
 from . import __init__ as _
-from ..models import user_model, post_model, comment_model, like_model
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+from ..db import is_replica
+from ..models import post_model, like_model
+from ..loaders import get_user_loader
+from ..auth import AuthUser, resolve_user
+from ..counters import view_counter
+from ..detail_cache import post_detail_cache, LIKES
+from ..feed_window import feed_window, FeedCard
+from ..http_cache import (
+    FEED_CACHE_MAX_AGE_SEC,
+    PRIVATE_CACHE_CONTROL,
+    make_etag,
+    etag_matches,
+    cache_headers,
+    not_modified,
+)
+from .comment_controller import get_comment_page, COMMENTS_PAGE_SIZE
+from ..schemas.post_schema import PostCard, PostList, PostListResponse, PostDetail, PostDetailResponse
+from ..summary.engine import summary_engine
+from ..summary.jobs import summary_worker, is_async_mode
 
-model_path = "./ai/kobart-summary-v3"
+MAX_POSTS_PAGE_SIZE = 100
 
-tokenizer = AutoTokenizer.from_pretrained(model_path)
-model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
-
-async def list_posts(cursor_id: int, count: int, db: AsyncSession):
-    if count <= 0 or cursor_id < 0:
+async def list_posts(cursor_id: int, count: int, before: int | None, order: str, request: Request, db: AsyncSession):
+    if count <= 0 or cursor_id < 0 or order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="invalid_posts_list_request")
+    if before is not None and before < 0:
         raise HTTPException(status_code=400, detail="invalid_posts_list_request")
     try:
-        filtered = await post_model.get_post_list_by_id(db, cursor_id)
-        sliced = filtered[:count]
-        next_cursor = sliced[-1].post_id if sliced else cursor_id
-
-        data_list = []
-        for p in sliced:
-            author = await user_model.get_user_by_id(db, p.user_id)
-            data_list.append(
-                {
-                    "post_id": p.post_id,
-                    "title": p.title,
-                    "author_nickname": author.nickname,
-                    "author_profile_image": author.profile_image,
-                    "created_at": p.created_at.strftime("%Y-%m-%d %H:%M:%S") if p.created_at else None,
-                    "summary": p.summary,
-                    "views": p.views,
-                    "comments_count": p.comments_count,
-                    "likes": p.likes,
-                }
+        count = min(count, MAX_POSTS_PAGE_SIZE)
+        # before 커서가 있으면 최신순(post_id 내림차순)으로 조회
+        descending = before is not None or order == "desc"
+        cursor = before if descending else cursor_id
+        # 최신 게시글 창 안에서 답할 수 있으면 DB 를 거치지 않는다
+        page = feed_window.page(cursor, count, descending)
+        if page is not None:
+            cards, has_more = page
+        else:
+            posts, has_more = await post_model.get_post_page(db, cursor, count, descending)
+            authors = await get_user_loader(db).load_many([p.user_id for p in posts])
+            cards = [FeedCard(p, authors[p.user_id]) for p in posts]
+        next_cursor = cards[-1].post_id if cards else cursor
+
+        # 로그인 상태면 이 페이지 게시글들에 대한 내 좋아요를 한 번에 조회
+        session_user_id = request.session.get("user_id")
+        my_likes = {}
+        if session_user_id and cards:
+            my_likes = await like_model.get_my_likes_for_posts(db, session_user_id, [c.post_id for c in cards])
+
+        # 목록 버전: 페이지에 담길 값들로 ETag 를 만들고, 같으면 본문을 만들지 않고 304
+        etag = make_etag(
+            "feed",
+            next_cursor,
+            has_more,
+            *(
+                (
+                    p.post_id,
+                    p.title,
+                    p.author_nickname,
+                    p.author_profile_image,
+                    p.created_at,
+                    p.summary,
+                    p.summary_status,
+                    p.views + view_counter.pending(p.post_id),
+                    p.comments_count,
+                    p.likes,
+                    my_likes.get(p.post_id),
+                )
+                for p in cards
+            ),
+        )
+        cache_control = PRIVATE_CACHE_CONTROL if session_user_id else f"public, max-age={FEED_CACHE_MAX_AGE_SEC}"
+        headers = cache_headers(etag, cache_control)
+        if etag_matches(request, etag):
+            return not_modified(headers)
+
+        post_list = [
+            PostCard(
+                p.post_id,
+                p.title,
+                p.author_nickname,
+                p.author_profile_image,
+                p.created_at,
+                p.summary,
+                p.summary_status,
+                p.views + view_counter.pending(p.post_id),
+                p.comments_count,
+                p.likes,
+                p.post_id in my_likes,
+                my_likes.get(p.post_id),
             )
-        return JSONResponse(
+            for p in cards
+        ]
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "detail": "posts_list_success",
-                "data": {"post_list": data_list, "next_cursor": next_cursor},
-            },
+            content=PostListResponse("posts_list_success", PostList(post_list, next_cursor, has_more)),
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -50,7 +108,7 @@ async def list_posts(cursor_id: int, count: int, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
-async def create_post(request: Request, db: AsyncSession):
+async def create_post(request: Request, db: AsyncSession, me: AuthUser | None):
     try:
         body = await request.json()
     except Exception:
@@ -68,22 +126,27 @@ async def create_post(request: Request, db: AsyncSession):
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
 
-        user = await user_model.get_user_by_id(db, user_id)
+        user = await resolve_user(db, user_id, me)
         if not user:
             raise HTTPException(status_code=400, detail="invalid_post_create_request")
 
         if user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
         
-        inputs = tokenizer(content, return_tensors="pt")
-        summary_ids = model.generate(**inputs, max_length=200)
-        summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-        
-        post = await post_model.create_post(db, user_id, title, content, summary, image_url, user.nickname)
+        if is_async_mode():
+            post = await post_model.create_post(db, user_id, title, content, None, image_url, user.nickname, "pending")
+            summary_worker.notify()
+        else:
+            summary = await summary_engine.summarize(content)
+            post = await post_model.create_post(db, user_id, title, content, summary, image_url, user.nickname)
+        feed_window.add(post, user)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
-            content={"detail": "post_create_success", "data": {"post_id": post.post_id}},
+            content={
+                "detail": "post_create_success",
+                "data": {"post_id": post.post_id, "summary_status": post.summary_status},
+            },
         )
     except HTTPException:
         raise
@@ -115,22 +178,32 @@ async def update_post(post_id: int, request: Request, db: AsyncSession):
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
 
-        user = await user_model.get_user_by_id(db, user_id)
+        user = await get_user_loader(db).load(user_id)
         if not user:
             raise HTTPException(status_code=400, detail="invalid_post_update_request")
 
         if post.user_id != request.session["user_id"]:
             raise HTTPException(status_code=403, detail="forbidden_user")
         
-        inputs = tokenizer(content, return_tensors="pt")
-        summary_ids = model.generate(**inputs, max_length=200)
-        summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-        
-        post = await post_model.update_post(db, post, title, content, summary, image_url)
+        if content == post.content and post.summary_status != "failed":
+            # 본문이 그대로면 요약도 그대로 쓴다 (요약 대기 중이면 기존 작업이 마저 처리)
+            post = await post_model.update_post_meta(db, post, title, image_url)
+        elif is_async_mode():
+            post = await post_model.update_post(db, post, title, content, None, image_url, "pending")
+            summary_worker.notify()
+        else:
+            summary = await summary_engine.summarize(content)
+            post = await post_model.update_post(db, post, title, content, summary, image_url)
+
+        post_detail_cache.invalidate(post_id)
+        feed_window.update_content(post)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content={"detail": "post_update_success", "data": {"post_id": post_id}},
+            content={
+                "detail": "post_update_success",
+                "data": {"post_id": post_id, "summary_status": post.summary_status},
+            },
         )
     except HTTPException:
         raise
@@ -144,55 +217,39 @@ async def get_post_detail(post_id: int, request: Request, db: AsyncSession):
     if post_id < 0:
         raise HTTPException(status_code=400, detail="invalid_posts_detail_request")
 
-    post = await post_model.get_post_by_id(db, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="post_not_found")
+    cached = post_detail_cache.get(post_id)
+    if cached is None:
+        # 읽는 도중 무효화되면 이번에 읽은 값은 캐시에 넣지 않는다
+        generation = post_detail_cache.generation()
+        post = await post_model.get_post_detail_row(db, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="post_not_found")
     try:
         session_user_id = request.session.get("user_id")
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
 
-        post_comments = await comment_model.get_comment_by_post_id(db, post_id)
-        like_for_me = await like_model.get_my_like(db, post_id, session_user_id)
+        if cached is None:
+            cached = await _load_post_detail(post, db, generation)
+        cached, version = cached
 
-        comments_json = []
-        for c in post_comments:
-            author = await user_model.get_user_by_id(db, c.user_id)
-            comments_json.append(
-                {
-                    "comment_id": c.comment_id,
-                    "content": c.content,
-                    "author_nickname": author.nickname,
-                    "author_profile_image": author.profile_image,
-                    "created_at": c.created_at.strftime("%Y-%m-%d %H:%M:%S") if c.created_at else None,
-                    "user_id": c.user_id,
-                }
-            )
+        like_for_me = await like_model.get_my_like(db, post_id, session_user_id)
+        like_id = like_for_me.like_id if like_for_me else None
+        # 304 여도 조회는 조회라서 조회수는 올린다
+        view_counter.incr(post_id)
 
-        await post_model.update_views(db, post)
-        author = await user_model.get_user_by_id(db, post.user_id)
+        # 조회수는 매 요청마다 바뀌므로 ETag 에서 빼고, 재검증 응답에서는 이전 값을 그대로 쓴다
+        etag = make_etag("post", post_id, version, cached[LIKES], like_id)
+        headers = cache_headers(etag, PRIVATE_CACHE_CONTROL)
+        if etag_matches(request, etag):
+            return not_modified(headers)
 
-        return JSONResponse(
+        data = PostDetail(*cached, like_for_me is not None, like_id)
+        data.views += view_counter.pending(post_id)
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "detail": "post_detail_success",
-                "data": {
-                    "post_id": post.post_id,
-                    "title": post.title,
-                    "content": post.content,
-                    "image_url": getattr(post, "image_url", None),
-                    "author_nickname": author.nickname,
-                    "author_user_id": post.user_id,
-                    "created_at": post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else None,
-                    "updated_at": post.created_at.strftime("%Y-%m-%d %H:%M:%S") if post.created_at else None,
-                    "views": post.views,
-                    "likes": post.likes,
-                    "comments_count": post.comments_count,
-                    "comments": comments_json,
-                    "is_liked_by_me": like_for_me is not None,
-                    "like_id": like_for_me.like_id if like_for_me else None,
-                },
-            },
+            content=PostDetailResponse("post_detail_success", data),
+            headers=headers,
         )
     except HTTPException:
         raise
@@ -202,6 +259,38 @@ async def get_post_detail(post_id: int, request: Request, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
+async def _load_post_detail(post, db: AsyncSession, generation: int):
+    # 상세 응답 중 보는 사람과 상관없는 부분을 만들어 캐시에 넣는다
+    # 댓글은 첫 페이지만 담고 나머지는 /posts/{post_id}/comments 로 이어서 조회
+    comments, comments_next_cursor, comments_has_more = await get_comment_page(
+        db, post.post_id, 0, COMMENTS_PAGE_SIZE, extra_user_ids=(post.user_id,)
+    )
+    author = await get_user_loader(db).load(post.user_id)
+
+    # DETAIL_FIELDS 순서
+    data = [
+        post.post_id,
+        post.title,
+        post.content,
+        post.summary,
+        post.summary_status,
+        post.image_url,
+        author.nickname,
+        post.user_id,
+        post.created_at,
+        post.created_at,
+        post.views,
+        post.likes,
+        post.comments_count,
+        comments,
+        comments_next_cursor,
+        comments_has_more,
+    ]
+    user_ids = {post.user_id, *(c.user_id for c in comments)}
+    version = post_detail_cache.set(post.post_id, data, user_ids, from_replica=is_replica(db), since=generation)
+    return data, version
+
+
 async def delete_post(post_id: int, request: Request, db: AsyncSession):
     if post_id < 0:
         raise HTTPException(status_code=400, detail="invalid_post_delete_request")
@@ -218,7 +307,10 @@ async def delete_post(post_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
         
         await post_model.delete_post(db, post_id)
-        return JSONResponse(status_code=200, content={"detail": "post_delete_success"})
+        view_counter.discard(post_id)
+        post_detail_cache.invalidate(post_id)
+        feed_window.remove(post_id)
+        return ORJSONResponse(status_code=200, content={"detail": "post_delete_success"})
     except HTTPException:
         raise
     except Exception as e:
@@ -1,5 +1,5 @@
 from fastapi import Request, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from ..responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pathlib import Path
 import traceback
@@ -8,6 +8,10 @@ import uuid
 from . import __init__ as _
 from .. import utils
 from ..models import user_model
+from ..schemas.user_schema import LoginData, LoginResponse, ProfileData, ProfileResponse
+from ..detail_cache import post_detail_cache
+from ..feed_window import feed_window
+from ..auth import AuthUser, active_users, resolve_user
 
 async def login(request: Request, db: AsyncSession):
     try:
@@ -30,17 +34,12 @@ async def login(request: Request, db: AsyncSession):
         session_user_id = request.session.get("user_id")
 
         if session_id and session_email == email and session_user_id == user.user_id:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
-                content={
-                    "detail": "login_success",
-                    "data": {
-                        "user_id": user.user_id,
-                        "profile_img_url": getattr(user, "profile_image", None),
-                        "profile_nickname": user.nickname,
-                        "session_id": session_id,
-                    },
-                },
+                content=LoginResponse(
+                    "login_success",
+                    LoginData(user.user_id, getattr(user, "profile_image", None), user.nickname, session_id),
+                ),
             )
 
         if session_id and session_user_id != user.user_id:
@@ -51,17 +50,12 @@ async def login(request: Request, db: AsyncSession):
         request.session["email"] = email
         request.session["user_id"] = user.user_id
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "detail": "login_success",
-                "data": {
-                    "user_id": user.user_id,
-                    "profile_img_url": getattr(user, "profile_image", None),
-                    "profile_nickname": user.nickname,
-                    "session_id": new_session_id,
-                },
-            },
+            content=LoginResponse(
+                "login_success",
+                LoginData(user.user_id, getattr(user, "profile_image", None), user.nickname, new_session_id),
+            ),
         )
     except HTTPException:
         raise
@@ -98,7 +92,7 @@ async def signup(request: Request, db: AsyncSession):
 
         user = await user_model.create_user(db, email, hashed_password, nickname, profile_image)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "detail": "register_success",
@@ -120,7 +114,7 @@ async def check_email(email: str, db: AsyncSession):
         valid = utils.email_is_valid(email)
         if valid == True:
             exists = await user_model.get_user_by_email(db, email) is not None
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "detail": "email_check_success",
@@ -145,7 +139,7 @@ async def check_nickname(nickname: str, db: AsyncSession):
         valid = utils.nickname_is_valid(nickname)
         if valid:
             exists = await user_model.get_user_by_nickname(db, nickname) is not None
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
                 content={
                     "detail": "nickname_check_success",
@@ -165,7 +159,7 @@ async def check_nickname(nickname: str, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
-async def update_me(user_id: int, request: Request, db: AsyncSession):
+async def update_me(user_id: int, request: Request, db: AsyncSession, me: AuthUser | None):
     try:
         body = await request.json()
     except Exception:
@@ -181,25 +175,23 @@ async def update_me(user_id: int, request: Request, db: AsyncSession):
         if not session_user_id:
             raise HTTPException(status_code=401, detail="unauthorized_user")
         
-        user = await user_model.get_user_by_id(db, user_id)
-        if not user:
+        if not await resolve_user(db, user_id, me):
             raise HTTPException(status_code=400, detail="invalid_profile_update_request")
         
         if user_id != session_user_id:
             raise HTTPException(status_code=403, detail="forbidden_user")
 
-        user = await user_model.update_user_profile(db, user, nickname, profile_image)
+        updated = await user_model.update_user_profile(db, user_id, nickname, profile_image)
+        active_users.invalidate(user_id)
+        if not updated:
+            # 캐시로 존재를 확인했지만 다른 워커에서 이미 탈퇴한 사용자
+            raise HTTPException(status_code=400, detail="invalid_profile_update_request")
+        post_detail_cache.invalidate_user(user_id)
+        feed_window.update_author(user_id, nickname, profile_image)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
-            content={
-                "detail": "profile_update_success",
-                "data": {
-                    "user_id": user.user_id,
-                    "nickname": user.nickname,
-                    "profile_image": getattr(user, "profile_image", None),
-                }
-            }
+            content=ProfileResponse("profile_update_success", ProfileData(user_id, nickname, profile_image)),
         )
     except HTTPException:
         raise
@@ -239,7 +231,7 @@ async def update_password(user_id: int, request: Request, db: AsyncSession):
         hashed_new_password = await utils.hash_password_async(new_password)
 
         await user_model.update_user_password(db, user, hashed_new_password)
-        return JSONResponse(status_code=200, content={"detail": "password_update_success"})
+        return ORJSONResponse(status_code=200, content={"detail": "password_update_success"})
     except HTTPException:
         raise
     except Exception as e:
@@ -248,9 +240,9 @@ async def update_password(user_id: int, request: Request, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
-async def logout(user_id: int, request: Request, db: AsyncSession):
+async def logout(user_id: int, request: Request, db: AsyncSession, me: AuthUser | None):
     try:
-        if not await user_model.get_user_by_id(db, user_id):
+        if not await resolve_user(db, user_id, me):
             raise HTTPException(status_code=400, detail="invalid_logout_request")
     
         session_email = request.session.get("email")
@@ -264,7 +256,7 @@ async def logout(user_id: int, request: Request, db: AsyncSession):
             raise HTTPException(status_code=403, detail="forbidden_user")
 
         request.session.clear()
-        return JSONResponse(status_code=200, content={"detail": "logout_success"})
+        return ORJSONResponse(status_code=200, content={"detail": "logout_success"})
     except HTTPException:
         raise
     except Exception as e:
@@ -273,9 +265,9 @@ async def logout(user_id: int, request: Request, db: AsyncSession):
         raise HTTPException(status_code=500, detail="internal_server_error")
 
 
-async def delete_user(user_id: int, request: Request, db: AsyncSession):
+async def delete_user(user_id: int, request: Request, db: AsyncSession, me: AuthUser | None):
     try:
-        if not await user_model.get_user_by_id(db, user_id):
+        if not await resolve_user(db, user_id, me):
             raise HTTPException(status_code=400, detail="invalid_user_delete_request")
     
         session_email = request.session.get("email")
@@ -291,7 +283,10 @@ async def delete_user(user_id: int, request: Request, db: AsyncSession):
         request.session.clear()
         
         await user_model.delete_user(db, user_id)
-        return JSONResponse(status_code=200, content={"detail": "user_delete_success"})
+        active_users.invalidate(user_id)
+        post_detail_cache.invalidate_user(user_id)
+        feed_window.remove_user(user_id)
+        return ORJSONResponse(status_code=200, content={"detail": "user_delete_success"})
     except HTTPException:
         raise
     except Exception as e:
@@ -326,7 +321,7 @@ async def upload_image (file: UploadFile):
         base_url = "http://localhost:8000"
         public_path = base_url + public_path
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=201,
             content={
                 "detail": "image_upload_success",
@@ -0,0 +1,88 @@
+import os
+import asyncio
+import traceback
+from collections import defaultdict
+from app.db import AsyncSessionLocal
+from app.models import post_model
+from app.detail_cache import post_detail_cache
+from app.feed_window import feed_window
+
+VIEW_FLUSH_INTERVAL_MS = int(os.getenv("VIEW_FLUSH_INTERVAL_MS", "1000"))
+VIEW_FLUSH_THRESHOLD = int(os.getenv("VIEW_FLUSH_THRESHOLD", "500"))
+
+
+class ViewCounterBuffer:
+    # 상세 조회마다 UPDATE 하지 않고 post_id 별 증가량을 메모리에 모았다가
+    # flush_interval 마다 또는 threshold 건이 쌓이면 UPDATE ... CASE 한 번으로 반영한다.
+    def __init__(self, flush_interval_ms: int, threshold: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.threshold = threshold
+        self._deltas = defaultdict(int)
+        self._count = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def incr(self, post_id: int, amount: int = 1):
+        self._deltas[post_id] += amount
+        self._count += amount
+        if self._count >= self.threshold:
+            self._wakeup.set()
+
+    def pending(self, post_id: int) -> int:
+        # 아직 DB 에 반영되지 않은 증가량. 응답의 조회수에 더해서 보여준다.
+        return self._deltas.get(post_id, 0)
+
+    def discard(self, post_id: int):
+        self._count -= self._deltas.pop(post_id, 0)
+
+    async def flush(self):
+        if not self._deltas:
+            return
+        deltas = self._deltas
+        self._deltas = defaultdict(int)
+        self._count = 0
+        try:
+            async with AsyncSessionLocal() as db:
+                await post_model.add_views(db, deltas)
+        except Exception:
+            # 실패한 증가량은 다음 flush 때 다시 시도한다
+            for post_id, amount in deltas.items():
+                self.incr(post_id, amount)
+            raise
+        post_detail_cache.add_views(deltas)
+        feed_window.add_views(deltas)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 종료 전에 남은 증가량을 반영. 실패해도 lifespan 의 나머지 정리는 계속되어야 하므로 로그만 남긴다
+        try:
+            await self.flush()
+        except Exception as e:
+            print("[view-counter] final flush failed:", repr(e))
+            traceback.print_exc()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                print("[view-counter] flush failed:", repr(e))
+                traceback.print_exc()
+
+
+view_counter = ViewCounterBuffer(VIEW_FLUSH_INTERVAL_MS, VIEW_FLUSH_THRESHOLD)
@@ -1,8 +1,14 @@
 import os
+import time
+import itertools
 from dotenv import load_dotenv
+from fastapi import Request
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from collections.abc import AsyncGenerator
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import event
+from sqlalchemy.orm import declarative_base, Session
+from app.metrics import TimedQueuePool, instrument_engine
+from app.profiler import SQL_PROFILE, profile_engine
 
 load_dotenv()
 
@@ -12,15 +18,120 @@ DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 DB_NAME = os.getenv("DB_NAME")
 DB_CHARSET = os.getenv("DB_CHARSET", "utf8mb4")
+DB_ECHO = os.getenv("DB_ECHO", "0") == "1"  # 개발 중에 SQL 로그가 필요하면 1
 
-DATABASE_URL = f"mysql+asyncmy://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset={DB_CHARSET}"
+# 읽기 전용 복제본: "host1:3306,host2:3306" (계정/DB 이름은 primary 와 같다). 비워두면 모든 요청이 primary 로 간다
+DB_REPLICA_HOSTS = [h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()]
+DB_REPLICA_POLICY = os.getenv("DB_REPLICA_POLICY", "round_robin")  # round_robin | least_conn
+# 쓰기 요청을 보낸 사용자는 이 시간(초) 동안 읽기도 primary 에서 한다 (복제 지연 동안 자기 글이 안 보이는 문제 방지)
+DB_STICKY_SEC = float(os.getenv("DB_STICKY_SEC", "5"))
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+# DATABASE_URL 을 직접 주면 그대로 쓴다 (예: 벤치마크용 sqlite+aiosqlite:///./bench.sqlite)
+DATABASE_URL = os.getenv("DATABASE_URL") or (
+    f"mysql+asyncmy://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset={DB_CHARSET}"
+)
+
+engine = create_async_engine(
+    DATABASE_URL, echo=DB_ECHO, future=True, poolclass=TimedQueuePool, pool_logging_name="primary"
+)
+instrument_engine("primary", engine)
+if SQL_PROFILE:
+    profile_engine(engine)
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False,)
 
 Base = declarative_base()
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+
+def _replica_url(host: str) -> str:
+    if ":" not in host:
+        host = f"{host}:{DB_PORT}"
+    return f"mysql+asyncmy://{DB_USER}:{DB_PASSWORD}@{host}/{DB_NAME}?charset={DB_CHARSET}"
+
+
+def _checked_out(e) -> int:
+    checkedout = getattr(e.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+class ReplicaRouter:
+    # 읽기 전용 세션을 복제본 중 하나에 붙여준다
+    def __init__(self, engines: list, policy: str):
+        if policy not in ("round_robin", "least_conn"):
+            raise ValueError(f"invalid DB_REPLICA_POLICY: {policy}")
+        self.engines = engines
+        self.policy = policy
+        self._makers = [
+            async_sessionmaker(bind=e, class_=AsyncSession, autoflush=False, expire_on_commit=False, info={"replica": True})
+            for e in engines
+        ]
+        self._next = itertools.cycle(range(len(engines)))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.engines)
+
+    def _pick(self) -> int:
+        if self.policy == "least_conn":
+            # 지금 빌려간 커넥션이 가장 적은 복제본
+            return min(range(len(self.engines)), key=lambda i: _checked_out(self.engines[i]))
+        return next(self._next)
+
+    def session(self) -> AsyncSession:
+        return self._makers[self._pick()]()
+
+
+def _replica_engine(i: int, host: str):
+    name = f"replica{i}"
+    e = create_async_engine(
+        _replica_url(host), echo=DB_ECHO, future=True, poolclass=TimedQueuePool, pool_logging_name=name
+    )
+    instrument_engine(name, e)
+    if SQL_PROFILE:
+        profile_engine(e)
+    return e
+
+
+replica_router = ReplicaRouter([_replica_engine(i, h) for i, h in enumerate(DB_REPLICA_HOSTS)], DB_REPLICA_POLICY)
+
+
+async def dispose_engines():
+    # 종료 시 풀에 남아 있는 커넥션을 닫는다
+    await engine.dispose()
+    for e in replica_router.engines:
+        await e.dispose()
+
+
+def is_replica(db: AsyncSession) -> bool:
+    return bool(db.info.get("replica"))
+
+
+def _sticky(request: Request) -> bool:
+    return request.session.get("db_primary_until", 0) > time.time()
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_primary_reads(session: Session):
+    # 로그인한 사용자의 쓰기가 커밋된 시점부터 DB_STICKY_SEC 동안 읽기도 primary 로 보내도록 세션 쿠키에 표시한다.
+    # 요청 시작 시점에 표시하면 동기 요약처럼 오래 걸리는 쓰기는 응답 전에 창이 끝나고, 실패한 요청도 쿠키를 다시 쓰게 된다.
+    request = session.info.get("request")
+    if request is not None and request.session.get("user_id"):
+        request.session["db_primary_until"] = time.time() + DB_STICKY_SEC
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # 쓰기 요청용: 항상 primary
     async with AsyncSessionLocal() as session:
+        if replica_router.enabled:
+            session.info["request"] = request
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    # 읽기 전용 요청용: 복제본이 있으면 복제본, 최근에 쓴 사용자면 primary
+    if not replica_router.enabled or _sticky(request):
+        async with AsyncSessionLocal() as session:
+            yield session
+        return
+    async with replica_router.session() as session:
         yield session
@@ -0,0 +1,103 @@
+import os
+import time
+import hashlib
+from app.cache import LRUCache
+from app.responses import dumps
+from app.db import DB_STICKY_SEC
+from app.schemas.post_schema import PostDetail
+
+POST_DETAIL_CACHE_SIZE = int(os.getenv("POST_DETAIL_CACHE_SIZE", "1024"))
+POST_DETAIL_CACHE_TTL_SEC = float(os.getenv("POST_DETAIL_CACHE_TTL_SEC", "30"))
+
+# 캐시에는 PostDetail 필드 순서대로 값만 담은 리스트를 둔다 (보는 사람마다 다른 마지막 두 필드는 뺀다).
+# 응답할 때 PostDetail(*values, is_liked_by_me, like_id) 로 바로 만들고, 카운터는 인덱스로 고친다.
+DETAIL_FIELDS = tuple(PostDetail.__dataclass_fields__)[:-2]
+VIEWS = DETAIL_FIELDS.index("views")
+LIKES = DETAIL_FIELDS.index("likes")
+
+
+class PostDetailCache:
+    # 게시글 상세 응답 중 보는 사람과 상관없는 부분(게시글, 작성자, 댓글 첫 페이지, 카운터)을 캐시한다.
+    # 내 좋아요 여부와 아직 반영 안 된 조회수는 응답할 때 위에 덧붙인다.
+    # 쓰기 경로에서 직접 무효화하고, 다른 워커에서 바뀐 내용은 TTL 이 지나면 반영된다.
+    def __init__(self, maxsize: int, ttl: float, hold: float):
+        self._cache = LRUCache(maxsize, ttl)
+        # 무효화 직후 hold 초 동안은 복제본에서 읽은 값을 캐시에 넣지 않는다 (복제 지연된 옛 값이 TTL 동안 남는 것 방지)
+        self.hold = hold
+        # 무효화할 때마다 올라가는 번호. 읽기 시작할 때 받아두고, 그 뒤에 무효화된 게시글/사용자면
+        # primary 에서 읽었어도 쓰기 전의 값일 수 있으므로 캐시에 넣지 않는다
+        self._generation = 0
+        self._invalidated: dict = {}  # key -> (무효화 시각, generation)
+
+    def get(self, post_id: int):
+        # (data, version) 또는 None
+        entry = self._cache.get(post_id)
+        return (entry["data"], entry["version"]) if entry else None
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, post_id: int, data: list, user_ids, from_replica: bool = False, since: int | None = None):
+        # data: DETAIL_FIELDS 순서의 값 리스트
+        # user_ids: 응답에 프로필이 들어간 사용자들 (프로필 변경 시 무효화용)
+        # version: 캐시에 넣을 때 한 번만 계산하는 내용 해시. 계속 바뀌는 카운터(조회수, 좋아요)는 뺀다
+        content = [v for i, v in enumerate(data) if i not in (VIEWS, LIKES)]
+        version = hashlib.blake2b(dumps(content), digest_size=8).hexdigest()
+        if not self._stale((("post", post_id), *(("user", u) for u in user_ids)), from_replica, since):
+            self._cache.set(post_id, {"data": data, "version": version, "user_ids": frozenset(user_ids)})
+        return version
+
+    def _mark(self, key):
+        now = time.monotonic()
+        if len(self._invalidated) > 10_000:
+            # 아직 읽고 있는 요청의 generation 비교에도 쓰이므로 최소 1분은 남긴다
+            keep = max(self.hold, 60)
+            self._invalidated = {k: m for k, m in self._invalidated.items() if now - m[0] < keep}
+        self._generation += 1
+        self._invalidated[key] = (now, self._generation)
+
+    def _stale(self, keys, from_replica: bool, since: int | None) -> bool:
+        now = time.monotonic()
+        for key in keys:
+            mark = self._invalidated.get(key)
+            if mark is None:
+                continue
+            marked_at, generation = mark
+            if since is not None and generation > since:
+                return True
+            if from_replica and now - marked_at < self.hold:
+                return True
+        return False
+
+    def invalidate(self, post_id: int):
+        self._cache.delete(post_id)
+        self._mark(("post", post_id))
+
+    def invalidate_user(self, user_id: int):
+        for post_id, entry in self._cache.items():
+            if user_id in entry["user_ids"]:
+                self._cache.delete(post_id)
+        self._mark(("user", user_id))
+
+    def set_likes(self, post_id: int, likes: int | None):
+        # 캐시에 있으면 그 자리에서 고치고, 없으면 지금 읽고 있는 요청이 옛 값을 넣지 않도록 무효화로 표시한다
+        entry = self._cache.peek(post_id)
+        if entry is None:
+            self._mark(("post", post_id))
+        elif likes is not None:
+            entry["data"][LIKES] = likes
+
+    def add_views(self, deltas: dict):
+        # 조회수 버퍼가 DB 에 반영한 만큼 캐시에 있는 조회수도 올려준다 (없는 게시글은 set_likes 와 같이 표시)
+        for post_id, amount in deltas.items():
+            entry = self._cache.peek(post_id)
+            if entry is None:
+                self._mark(("post", post_id))
+            else:
+                entry["data"][VIEWS] += amount
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+post_detail_cache = PostDetailCache(POST_DETAIL_CACHE_SIZE, POST_DETAIL_CACHE_TTL_SEC, DB_STICKY_SEC)
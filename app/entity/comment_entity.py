@@ -1,8 +1,11 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index, func
 from app.db import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_post_id_comment_id", "post_id", "comment_id"),
+    )
 
     comment_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     post_id = Column(Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False)
@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from app.db import Base
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        Index("uq_likes_post_user", "post_id", "user_id", unique=True),
+    )
 
     like_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     post_id =Column(Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
-
@@ -1,14 +1,19 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, func
 from app.db import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_user_id", "user_id"),
+        Index("ix_posts_created_at", "created_at"),
+    )
 
     post_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(String(255), nullable=True)
+    summary_status = Column(String(10), nullable=False, server_default="done")  # pending / done / failed
     image_url = Column(String(500), nullable=True)
     author_nickname = Column(String(50), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, DateTime, func
+from app.db import Base
+
+class SummaryCache(Base):
+    __tablename__ = "summary_cache"
+
+    content_hash = Column(String(64), primary_key=True)  # sha256(모델 설정 + 정규화된 본문)
+    summary = Column(String(255), nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
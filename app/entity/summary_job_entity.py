@@ -0,0 +1,13 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, String
+from app.db import Base
+
+class SummaryJob(Base):
+    __tablename__ = "summary_jobs"
+
+    job_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    post_id = Column(Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), unique=True, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String(255), nullable=True)
+    next_run_at = Column(DateTime, nullable=False, default=datetime.now, index=True)
+    locked_at = Column(DateTime, nullable=True)
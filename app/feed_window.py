@@ -0,0 +1,190 @@
+import os
+import time
+import asyncio
+import traceback
+from bisect import bisect_left, bisect_right, insort
+from app.db import AsyncSessionLocal
+from app.models import post_model
+from app.loaders import get_user_loader
+
+FEED_WINDOW_SIZE = int(os.getenv("FEED_WINDOW_SIZE", "500"))  # 0 이면 사용 안 함
+FEED_WINDOW_TTL_SEC = float(os.getenv("FEED_WINDOW_TTL_SEC", "5"))
+FEED_WINDOW_CHECK_SEC = float(os.getenv("FEED_WINDOW_CHECK_SEC", "1"))
+
+
+class FeedCard:
+    # 목록 응답 한 줄에 필요한 값만 들고 있는 작은 객체
+    __slots__ = (
+        "post_id",
+        "user_id",
+        "title",
+        "author_nickname",
+        "author_profile_image",
+        "created_at",
+        "summary",
+        "summary_status",
+        "views",
+        "comments_count",
+        "likes",
+    )
+
+    def __init__(self, post, author):
+        self.post_id = post.post_id
+        self.user_id = post.user_id
+        self.author_nickname = author.nickname if author else post.author_nickname
+        self.author_profile_image = author.profile_image if author else None
+        self.created_at = post.created_at
+        self.views = post.views
+        self.comments_count = post.comments_count
+        self.likes = post.likes
+        self.set_content(post)
+
+    def set_content(self, post):
+        self.title = post.title
+        self.summary = post.summary
+        self.summary_status = post.summary_status
+
+
+class FeedWindow:
+    # 최신 게시글 size 개의 카드를 post_id 오름차순으로 메모리에 들고 있다.
+    # floor 이상인 게시글은 빠짐없이 창 안에 있다는 것이 불변 조건이라서,
+    # 커서가 창 안에 들어오는 목록 요청은 DB 없이 응답할 수 있다.
+    # 이 프로세스의 쓰기는 바로 반영한다. 다른 워커의 쓰기는 요청 경로가 아니라 백그라운드 태스크가 반영한다:
+    # check_interval 마다 창 범위의 최대 id / 개수를 비교해서 추가/삭제가 있으면 다시 읽고,
+    # 수정/카운터/작성자 변경은 ttl 마다 다시 읽어서 반영한다.
+    def __init__(self, size: int, ttl: float, check_interval: float):
+        self.size = size
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._ids: list[int] = []
+        self._cards: dict[int, FeedCard] = {}
+        self._floor = 0
+        self._loaded_at: float | None = None
+        self._checked_at: float | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    def _usable(self) -> bool:
+        # 갱신 태스크가 한동안 확인에 성공하지 못했으면 (DB 장애 등) 창을 쓰지 않고 SQL 로 조회한다
+        limit = max(self.ttl, self.check_interval * 3)
+        return self._checked_at is not None and time.monotonic() - self._checked_at < limit
+
+    async def reload(self):
+        # 창은 primary 에서 읽는다 (복제 지연된 창이 남지 않도록). 카드에 필요한 컬럼만 조회한다
+        async with AsyncSessionLocal() as primary:
+            posts, has_more = await post_model.get_feed_cards(primary, self.size)
+            authors = await get_user_loader(primary).load_many([p.user_id for p in posts])
+        self._cards = {p.post_id: FeedCard(p, authors[p.user_id]) for p in posts}
+        self._ids = sorted(self._cards)
+        # 테이블 전체가 창에 들어왔으면 floor = 0
+        self._floor = self._ids[0] if has_more else 0
+        self._loaded_at = self._checked_at = time.monotonic()
+
+    async def _in_sync(self) -> bool:
+        async with AsyncSessionLocal() as primary:
+            newest, count = await post_model.get_post_range_stats(primary, self._floor)
+        return newest == (self._ids[-1] if self._ids else None) and count == len(self._ids)
+
+    async def refresh(self):
+        if self._loaded_at is None or time.monotonic() - self._loaded_at >= self.ttl or not await self._in_sync():
+            await self.reload()
+        else:
+            self._checked_at = time.monotonic()
+
+    def start(self):
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print("[feed-window] refresh failed:", repr(e))
+                traceback.print_exc()
+            await asyncio.sleep(self.check_interval)
+
+    def page(self, cursor: int | None, count: int, descending: bool):
+        # 창 안에서 답할 수 있으면 (cards, has_more), 아니면 None (SQL 로 조회). DB 는 건드리지 않는다
+        if not self.enabled or not self._usable():
+            return None
+        ids = self._ids
+        if descending:
+            end = len(ids) if cursor is None else bisect_left(ids, cursor)
+            if end > count:
+                return [self._cards[i] for i in reversed(ids[end - count:end])], True
+            if self._floor == 0:
+                return [self._cards[i] for i in reversed(ids[:end])], False
+            return None
+        if cursor + 1 < self._floor:
+            return None
+        start = bisect_right(ids, cursor)
+        return [self._cards[i] for i in ids[start:start + count]], len(ids) - start > count
+
+    # --- 쓰기 경로에서 호출 ---
+    def add(self, post, author):
+        if self._loaded_at is None or post.post_id < self._floor:
+            return
+        self._cards[post.post_id] = FeedCard(post, author)
+        insort(self._ids, post.post_id)
+        while len(self._ids) > self.size:
+            oldest = self._ids.pop(0)
+            del self._cards[oldest]
+            self._floor = oldest + 1
+
+    def update_content(self, post):
+        card = self._cards.get(post.post_id)
+        if card is not None:
+            card.set_content(post)
+
+    def set_summary(self, post_id: int, summary: str | None, status: str):
+        card = self._cards.get(post_id)
+        if card is not None:
+            if summary is not None:
+                card.summary = summary
+            card.summary_status = status
+
+    def set_likes(self, post_id: int, likes: int | None):
+        card = self._cards.get(post_id)
+        if card is not None and likes is not None:
+            card.likes = likes
+
+    def set_comments_count(self, post_id: int, comments_count: int | None):
+        card = self._cards.get(post_id)
+        if card is not None and comments_count is not None:
+            card.comments_count = comments_count
+
+    def add_views(self, deltas: dict):
+        for post_id, amount in deltas.items():
+            card = self._cards.get(post_id)
+            if card is not None:
+                card.views += amount
+
+    def remove(self, post_id: int):
+        if self._cards.pop(post_id, None) is not None:
+            self._ids.pop(bisect_left(self._ids, post_id))
+
+    def update_author(self, user_id: int, nickname: str, profile_image: str | None):
+        for card in self._cards.values():
+            if card.user_id == user_id:
+                card.author_nickname = nickname
+                card.author_profile_image = profile_image
+
+    def remove_user(self, user_id: int):
+        for post_id in [c.post_id for c in self._cards.values() if c.user_id == user_id]:
+            self.remove(post_id)
+
+
+feed_window = FeedWindow(FEED_WINDOW_SIZE, FEED_WINDOW_TTL_SEC, FEED_WINDOW_CHECK_SEC)
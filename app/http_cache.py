@@ -0,0 +1,41 @@
+import os
+import hashlib
+from fastapi import Request
+from fastapi.responses import Response
+
+# 로그인하지 않은 목록 응답은 프록시가 이 시간(초) 동안 그대로 재사용할 수 있다
+FEED_CACHE_MAX_AGE_SEC = int(os.getenv("FEED_CACHE_MAX_AGE_SEC", "5"))
+
+# 사람마다 다른 응답(내 좋아요 여부)은 프록시에 저장하지 않고, 브라우저가 매번 ETag 로 재검증한다
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    # 응답 본문을 만들지 않고 버전 값들만으로 강한 ETag 를 만든다
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    for tag in header.split(","):
+        tag = tag.strip()
+        # If-None-Match 는 약한 비교라서 W/ 접두어는 무시한다
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def cache_headers(etag: str, cache_control: str) -> dict:
+    # 세션 쿠키에 따라 응답이 달라지므로 Vary: Cookie
+    return {"ETag": etag, "Cache-Control": cache_control, "Vary": "Cookie"}
+
+
+def not_modified(headers: dict) -> Response:
+    return Response(status_code=304, headers=headers)
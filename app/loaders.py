@@ -0,0 +1,44 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from .models import user_model
+
+
+class UserLoader:
+    # 요청 하나 동안 필요한 user_id 를 모아서 IN 쿼리 한 번으로 조회하고 결과를 기억한다.
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._users = {}
+        self._pending = set()
+
+    def prime(self, *user_ids):
+        for user_id in user_ids:
+            if user_id is not None and user_id not in self._users:
+                self._pending.add(user_id)
+
+    async def load(self, user_id):
+        self.prime(user_id)
+        await self._dispatch()
+        return self._users.get(user_id)
+
+    async def load_many(self, user_ids):
+        self.prime(*user_ids)
+        await self._dispatch()
+        return {user_id: self._users.get(user_id) for user_id in user_ids}
+
+    async def _dispatch(self):
+        if not self._pending:
+            return
+        user_ids = list(self._pending)
+        self._pending.clear()
+        users = await user_model.get_users_by_ids(self.db, user_ids)
+        found = {u.user_id: u for u in users}
+        for user_id in user_ids:
+            self._users[user_id] = found.get(user_id)
+
+
+def get_user_loader(db: AsyncSession) -> UserLoader:
+    # 세션은 get_db 에서 요청마다 새로 만들어지므로 세션 info 에 붙여두면 요청 단위로 공유된다.
+    loader = db.info.get("user_loader")
+    if loader is None:
+        loader = UserLoader(db)
+        db.info["user_loader"] = loader
+    return loader
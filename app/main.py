@@ -1,6 +1,9 @@
 import os
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,12 +11,39 @@ from .routers.user_routes import router as user_router
 from .routers.post_routes import router as post_router
 from .routers.comment_routes import router as comment_router
 from .routers.like_routes import router as like_router
+from .summary.engine import summary_engine, SUMMARY_PRELOAD, SUMMARY_WARMUP
+from .summary.jobs import summary_worker
+from .counters import view_counter
+from .detail_cache import post_detail_cache
+from .feed_window import feed_window
+from .auth import active_users
+from . import metrics
+from .profiler import SQL_PROFILE, SqlProfilerMiddleware
+from .db import dispose_engines
 from dotenv import load_dotenv
 
 load_dotenv()
 SECRET_KEY = os.getenv("SESSION_SECRET_KEY")
 
-app = FastAPI(title="Community API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    preload_task = None
+    if SUMMARY_PRELOAD:
+        preload_task = asyncio.create_task(summary_engine.preload(SUMMARY_WARMUP))
+    # 모드와 상관없이 워커를 띄워서, 이전에 async 모드로 쌓인 작업도 마저 처리한다
+    summary_worker.start()
+    view_counter.start()
+    feed_window.start()
+    yield
+    await feed_window.stop()
+    await view_counter.stop()
+    await summary_worker.stop()
+    if preload_task is not None:
+        preload_task.cancel()
+    await summary_engine.close()
+    await dispose_engines()
+
+app = FastAPI(title="Community API", lifespan=lifespan)
 
 origins = [
     "http://localhost:5500",   # 아래에서 띄울 프론트 서버
@@ -37,6 +67,36 @@ app.add_middleware(
     https_only=False,
 )
 
+# 개발/스테이징에서만: 요청별 SQL 수/시간 헤더와 N+1 의심 로그
+if SQL_PROFILE:
+    app.add_middleware(SqlProfilerMiddleware)
+
+# 가장 바깥에서 요청 전체 시간을 잰다
+app.add_middleware(metrics.MetricsMiddleware)
+
+@app.get("/health")
+async def health():
+    # 요약 모델을 미리 올리는 설정이면 로딩이 끝날 때까지 503 (롤링 재시작 시 트래픽 투입 시점 판단용)
+    summary_ready = summary_engine.ready
+    if not summary_ready:
+        summary_engine.probe_ready()
+    status_code = 503 if SUMMARY_PRELOAD and not summary_ready else 200
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "detail": "health_check_success",
+            "data": {
+                "summary_ready": summary_ready,
+                "post_detail_cache": post_detail_cache.stats(),
+                "active_user_cache": active_users.stats(),
+            },
+        },
+    )
+
+@app.get("/metrics")
+async def get_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 app.include_router(user_router)
 app.include_router(post_router)
 app.include_router(comment_router)
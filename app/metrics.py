@@ -0,0 +1,220 @@
+import time
+import contextvars
+from bisect import bisect_left
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Prometheus 텍스트 형식으로 내보내는 최소한의 메트릭.
+# 값은 모두 이벤트 루프 스레드에서만 바꾸기 때문에 락 없이 dict/list 를 그대로 쓴다.
+# (다른 스레드에서 잰 값은 이벤트 루프로 돌아온 뒤에 기록한다)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_registry = []
+
+
+def _labels(names, values) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, float] = {}
+        _registry.append(self)
+
+    def inc(self, *labels, amount=1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def collect(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in list(self._values.items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    # 버킷 경계를 미리 정해두고, 관측할 때는 해당 버킷 카운트 하나만 올린다 (누적은 내보낼 때 계산)
+    def __init__(self, name: str, help: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, list] = {}
+        _registry.append(self)
+
+    def observe(self, value, *labels):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def totals(self) -> tuple[int, float]:
+        # 모든 라벨을 합친 (관측 수, 합계)
+        count, total = 0, 0.0
+        for counts, value in list(self._series.values()):
+            count += sum(counts)
+            total += value
+        return count, total
+
+    def collect(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        names = self.labelnames + ("le",)
+        for labels, (counts, total) in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(names, labels + (_number(bound),))} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Gauge:
+    # 값은 내보낼 때 fn() 을 불러서 읽는다. fn 은 (labels, value) 목록을 돌려준다
+    def __init__(self, name: str, help: str, labelnames, fn):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.fn = fn
+        _registry.append(self)
+
+    def collect(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} gauge"
+        for labels, value in self.fn():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+def render() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+# --- HTTP ---
+HTTP_REQUESTS = Counter("http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+HTTP_LATENCY = Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+HTTP_DB_QUERIES = Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request", ("method", "route"), COUNT_BUCKETS
+)
+
+# --- DB ---
+DB_QUERIES = Counter("db_queries_total", "SQL statements executed", ("engine",))
+DB_POOL_WAIT = Histogram("db_pool_wait_seconds", "Time spent getting a connection from the pool (including opening a new one)", ("engine",))
+
+# --- 요약 ---
+SUMMARY_GENERATION = Histogram(
+    "summary_generation_seconds", "Time spent generating one summary batch", buckets=SLOW_BUCKETS
+)
+SUMMARY_BATCH_SIZE = Histogram("summary_batch_size", "Summaries generated per batch", buckets=COUNT_BUCKETS)
+
+# --- bcrypt ---
+BCRYPT_WAIT = Histogram("bcrypt_threadpool_wait_seconds", "Time a bcrypt call waited for a threadpool worker")
+BCRYPT_DURATION = Histogram("bcrypt_duration_seconds", "Time spent in bcrypt hash/verify", ("op",))
+
+
+class RequestStats:
+    # 요청 하나 동안 모으는 값 (contextvar 로 요청 단위로 분리)
+    __slots__ = ("queries",)
+
+    def __init__(self):
+        self.queries = 0
+
+
+_request_stats: contextvars.ContextVar[RequestStats | None] = contextvars.ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+class MetricsMiddleware:
+    # 라우트(경로 템플릿) 단위로 요청 수, 지연시간, 요청당 쿼리 수를 기록하는 ASGI 미들웨어
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            # 경로 변수별로 시계열이 늘어나지 않도록 실제 경로 대신 라우트 템플릿을 쓴다
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, route, status)
+            HTTP_LATENCY.observe(elapsed, method, route)
+            HTTP_DB_QUERIES.observe(stats.queries, method, route)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    # 커넥션을 빌릴 때 기다린 시간을 잰다. 엔진 이름은 pool_logging_name 으로 받는다
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - start, self.logging_name or "default")
+
+
+_engines: dict = {}
+
+
+def instrument_engine(name: str, engine):
+    _engines[name] = engine
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        DB_QUERIES.inc(name)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+
+
+def _pool_stat(attr):
+    def collect():
+        for name, engine in list(_engines.items()):
+            fn = getattr(engine.pool, attr, None)
+            if fn is not None:
+                yield (name,), fn()
+    return collect
+
+
+Gauge("db_pool_checked_out", "Connections currently checked out of the pool", ("engine",), _pool_stat("checkedout"))
+Gauge("db_pool_overflow", "Connections opened beyond pool_size", ("engine",), _pool_stat("overflow"))
+Gauge("db_pool_size", "Configured pool size", ("engine",), _pool_stat("size"))
@@ -0,0 +1,98 @@
+import importlib
+import pkgutil
+from datetime import datetime
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, select, insert, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.db import Base
+from app.migrations import versions
+
+# 적용된 마이그레이션 기록. 엔티티 테이블과 따로 관리해서 drop_all 대상에 섞이지 않게 한다.
+schema_metadata = MetaData()
+schema_version = Table(
+    "schema_version",
+    schema_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def load_migrations():
+    # app/migrations/versions/v0001_xxx.py 형태의 모듈을 VERSION 순서대로 불러온다
+    migrations = []
+    for info in pkgutil.iter_modules(versions.__path__):
+        if info.name.startswith("v"):
+            migrations.append(importlib.import_module(f"{versions.__name__}.{info.name}"))
+    migrations.sort(key=lambda m: m.VERSION)
+    numbers = [m.VERSION for m in migrations]
+    if len(numbers) != len(set(numbers)):
+        raise RuntimeError(f"duplicate migration version: {numbers}")
+    return migrations
+
+
+def _current_version(conn) -> int:
+    schema_metadata.create_all(conn, checkfirst=True)
+    return conn.execute(select(schema_version.c.version).order_by(schema_version.c.version.desc())).scalar() or 0
+
+
+def _record(conn, migration):
+    conn.execute(
+        insert(schema_version).values(
+            version=migration.VERSION, description=migration.DESCRIPTION, applied_at=datetime.now()
+        )
+    )
+
+
+async def current_version(engine: AsyncEngine) -> int:
+    async with engine.begin() as conn:
+        return await conn.run_sync(_current_version)
+
+
+async def upgrade(engine: AsyncEngine):
+    # 앞으로만 진행한다. 마이그레이션 하나마다 트랜잭션을 나누고 끝나면 바로 버전을 기록한다
+    # (MySQL DDL 은 트랜잭션으로 묶이지 않으므로 중간에 실패해도 어디까지 적용됐는지 남긴다).
+    current = await current_version(engine)
+    applied = []
+    for migration in load_migrations():
+        if migration.VERSION <= current:
+            continue
+        print(f"[migrate] {migration.VERSION:04d} {migration.DESCRIPTION}")
+        async with engine.begin() as conn:
+            await conn.run_sync(migration.upgrade)
+            await conn.run_sync(_record, migration)
+        applied.append(migration.VERSION)
+    return applied
+
+
+async def reset(engine: AsyncEngine):
+    # 모든 테이블을 지우고 현재 엔티티 기준으로 다시 만든 뒤 최신 버전으로 기록한다 (개발용)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(schema_metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(schema_metadata.create_all)
+        for migration in load_migrations():
+            await conn.run_sync(_record, migration)
+
+
+# 마이그레이션 모듈에서 쓰는 헬퍼. 이미 적용된 DB 에서 다시 실행돼도 문제 없게 확인 후 실행한다.
+def has_table(conn, table: str) -> bool:
+    return inspect(conn).has_table(table)
+
+
+def has_column(conn, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def has_index(conn, table: str, index: str) -> bool:
+    return any(i["name"] == index for i in inspect(conn).get_indexes(table))
+
+
+def create_index_if_missing(conn, table, index: str):
+    if has_index(conn, table.name, index):
+        return
+    for idx in table.indexes:
+        if idx.name == index:
+            idx.create(conn)
+            return
+    raise RuntimeError(f"index {index} is not declared on {table.name}")
@@ -0,0 +1,58 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, Text, ForeignKey, func
+
+VERSION = 1
+DESCRIPTION = "baseline tables (users, posts, comments, likes)"
+
+# 처음 create_table.py 로 만들던 시점의 테이블 정의를 그대로 고정해 둔다.
+# 엔티티(app/entity)는 이후 마이그레이션의 변경까지 반영된 최신 모습이라 여기서 쓰면 안 된다.
+metadata = MetaData()
+
+users = Table(
+    "users",
+    metadata,
+    Column("user_id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("email", String(255), unique=True, index=True, nullable=False),
+    Column("nickname", String(50), unique=True, index=True, nullable=False),
+    Column("password", String(255), nullable=False),
+    Column("profile_image", String(255)),
+)
+
+posts = Table(
+    "posts",
+    metadata,
+    Column("post_id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("user_id", Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("summary", String(255), nullable=True),
+    Column("image_url", String(500), nullable=True),
+    Column("author_nickname", String(50), nullable=False),
+    Column("created_at", DateTime, server_default=func.now()),
+    Column("updated_at", DateTime),
+    Column("views", Integer, nullable=False, server_default="0"),
+    Column("comments_count", Integer, nullable=False, server_default="0"),
+    Column("likes", Integer, nullable=False, server_default="0"),
+)
+
+comments = Table(
+    "comments",
+    metadata,
+    Column("comment_id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("post_id", Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False),
+    Column("user_id", Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("created_at", DateTime, server_default=func.now()),
+)
+
+likes = Table(
+    "likes",
+    metadata,
+    Column("like_id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("post_id", Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), nullable=False),
+    Column("user_id", Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False),
+)
+
+
+def upgrade(conn):
+    # 기존 create_table.py 로 만든 DB 라면 테이블이 이미 있으므로 건너뛴다
+    metadata.create_all(conn, checkfirst=True)
@@ -0,0 +1,36 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, ForeignKey, text, func
+from app.migrations.runner import has_column
+
+VERSION = 2
+DESCRIPTION = "posts.summary_status, summary_jobs, summary_cache"
+
+# 이 버전에서 추가한 테이블 정의를 고정해 둔다 (엔티티가 나중에 바뀌어도 이 마이그레이션은 그대로).
+# posts 는 외래 키 대상으로만 적어두고 만들지 않는다.
+metadata = MetaData()
+
+posts = Table("posts", metadata, Column("post_id", Integer, primary_key=True))
+
+summary_jobs = Table(
+    "summary_jobs",
+    metadata,
+    Column("job_id", Integer, primary_key=True, index=True, autoincrement=True),
+    Column("post_id", Integer, ForeignKey("posts.post_id", ondelete="CASCADE"), unique=True, nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("last_error", String(255), nullable=True),
+    Column("next_run_at", DateTime, nullable=False, index=True),
+    Column("locked_at", DateTime, nullable=True),
+)
+
+summary_cache = Table(
+    "summary_cache",
+    metadata,
+    Column("content_hash", String(64), primary_key=True),
+    Column("summary", String(255), nullable=False),
+    Column("created_at", DateTime, server_default=func.now()),
+)
+
+
+def upgrade(conn):
+    if not has_column(conn, "posts", "summary_status"):
+        conn.execute(text("ALTER TABLE posts ADD COLUMN summary_status VARCHAR(10) NOT NULL DEFAULT 'done'"))
+    metadata.create_all(conn, tables=[summary_jobs, summary_cache], checkfirst=True)
@@ -0,0 +1,54 @@
+from sqlalchemy import MetaData, Table, Column, Integer, DateTime, Index, text
+from app.migrations.runner import has_index, create_index_if_missing
+
+VERSION = 3
+DESCRIPTION = "indexes for feed, comments, likes (unique post_id+user_id)"
+
+# 이 버전에서 추가한 인덱스를 고정해 둔다. 테이블은 인덱스에 필요한 컬럼만 적고 만들지 않는다.
+metadata = MetaData()
+
+posts = Table(
+    "posts",
+    metadata,
+    Column("post_id", Integer, primary_key=True),
+    Column("user_id", Integer),
+    Column("created_at", DateTime),
+    Index("ix_posts_user_id", "user_id"),
+    Index("ix_posts_created_at", "created_at"),
+)
+
+comments = Table(
+    "comments",
+    metadata,
+    Column("comment_id", Integer, primary_key=True),
+    Column("post_id", Integer),
+    Index("ix_comments_post_id_comment_id", "post_id", "comment_id"),
+)
+
+likes = Table(
+    "likes",
+    metadata,
+    Column("like_id", Integer, primary_key=True),
+    Column("post_id", Integer),
+    Column("user_id", Integer),
+    Index("uq_likes_post_user", "post_id", "user_id", unique=True),
+)
+
+
+def upgrade(conn):
+    if not has_index(conn, "likes", "uq_likes_post_user"):
+        # 유니크 인덱스를 만들기 전에 중복 좋아요를 정리하고 좋아요 수를 다시 센다
+        deleted = conn.execute(text(
+            "DELETE FROM likes WHERE like_id NOT IN ("
+            " SELECT keep_id FROM (SELECT MIN(like_id) AS keep_id FROM likes GROUP BY post_id, user_id) AS keep"
+            ")"
+        )).rowcount
+        if deleted:
+            conn.execute(text(
+                "UPDATE posts SET likes = (SELECT COUNT(*) FROM likes WHERE likes.post_id = posts.post_id)"
+            ))
+        create_index_if_missing(conn, likes, "uq_likes_post_user")
+
+    create_index_if_missing(conn, comments, "ix_comments_post_id_comment_id")
+    create_index_if_missing(conn, posts, "ix_posts_user_id")
+    create_index_if_missing(conn, posts, "ix_posts_created_at")
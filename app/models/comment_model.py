@@ -1,18 +1,21 @@
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.comment_entity import Comment
+from app.models import post_model
 
 
 async def create_comment(db: AsyncSession, post_id: int, user_id: int, content: str):
+    # 댓글 insert 와 comments_count 증가를 한 트랜잭션으로 처리하고 새 댓글 수를 함께 돌려준다
     comment = Comment(
         post_id=post_id,
         user_id=user_id,
         content=content,
     )
     db.add(comment)
+    await db.flush()
+    comments_count = await post_model.add_comments_count(db, post_id, 1)
     await db.commit()
-    await db.refresh(comment)
-    return comment
+    return comment, comments_count
 
 
 async def get_comment_by_id(db: AsyncSession, comment_id: int):
@@ -27,12 +30,23 @@ async def update_comment(db: AsyncSession, comment: Comment, content: str):
     return comment
 
 
-async def delete_comment(db: AsyncSession, comment_id: int):
-    await db.execute(delete(Comment).where(Comment.comment_id == comment_id))
+async def delete_comment(db: AsyncSession, comment_id: int, post_id: int):
+    result = await db.execute(delete(Comment).where(Comment.comment_id == comment_id))
+    comments_count = None
+    if result.rowcount:
+        comments_count = await post_model.add_comments_count(db, post_id, -1)
     await db.commit()
-    return
+    return comments_count
 
 
-async def get_comment_by_post_id(db: AsyncSession, post_id: int):
-    result = await db.execute(select(Comment).where(Comment.post_id == post_id).order_by(Comment.comment_id.asc()))
-    return result.scalars().all()
+async def get_comment_page(db: AsyncSession, post_id: int, after: int, limit: int):
+    # (post_id, comment_id) 인덱스 범위 스캔. limit + 1 개로 다음 페이지 여부를 판단한다.
+    # 응답에 필요한 컬럼만 행으로 읽는다 (엔티티를 만들지 않는다)
+    result = await db.execute(
+        select(Comment.comment_id, Comment.content, Comment.created_at, Comment.user_id)
+        .where(Comment.post_id == post_id, Comment.comment_id > after)
+        .order_by(Comment.comment_id.asc())
+        .limit(limit + 1)
+    )
+    rows = result.all()
+    return rows[:limit], len(rows) > limit
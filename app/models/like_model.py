@@ -1,17 +1,56 @@
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.like_entity import Like
+from app.models import post_model
 
 
-async def create_like(db: AsyncSession, post_id: int, user_id: int):
-    like = Like(
-        post_id=post_id,
-        user_id=user_id,
+async def like_post(db: AsyncSession, post_id: int, user_id: int):
+    # (post_id, user_id) 유니크 인덱스에 기대서 INSERT IGNORE 한 문장으로 처리한다.
+    # 실제로 행이 추가됐을 때만 좋아요 수를 올린다. 반환값: (like_id, 새로 추가 여부, 좋아요 수)
+    stmt = (
+        insert(Like)
+        .values(post_id=post_id, user_id=user_id)
+        .prefix_with("IGNORE", dialect="mysql")
+        .prefix_with("OR IGNORE", dialect="sqlite")
     )
-    db.add(like)
+    try:
+        result = await db.execute(stmt)
+    except IntegrityError:
+        await db.rollback()
+        return await _current_like_state(db, post_id, user_id)
+
+    if not result.rowcount:
+        await db.rollback()
+        return await _current_like_state(db, post_id, user_id)
+
+    like_id = result.inserted_primary_key[0]
+    likes = await post_model.add_likes(db, post_id, 1)
+    if likes is None:
+        # 외래키를 검사하지 않는 DB 에서 없는 게시글에 들어간 경우
+        await db.rollback()
+        return None, False, None
+    await db.commit()
+    return like_id, True, likes
+
+
+async def unlike_post(db: AsyncSession, post_id: int, user_id: int):
+    # 반환값: (실제로 삭제됐는지, 좋아요 수)
+    result = await db.execute(delete(Like).where(Like.post_id == post_id, Like.user_id == user_id))
+    if not result.rowcount:
+        await db.rollback()
+        return False, await post_model.get_likes(db, post_id)
+    likes = await post_model.add_likes(db, post_id, -1)
     await db.commit()
-    await db.refresh(like)
-    return like
+    return True, likes
+
+
+async def _current_like_state(db: AsyncSession, post_id: int, user_id: int):
+    # 이미 눌려 있던 경우(또는 게시글이 없어서 무시된 경우)
+    like = await get_my_like(db, post_id, user_id)
+    if like is None:
+        return None, False, None
+    return like.like_id, False, await post_model.get_likes(db, post_id)
 
 
 async def get_like_by_id(db: AsyncSession, like_id: int):
@@ -24,7 +63,10 @@ async def get_my_like(db: AsyncSession, post_id: int, session_user_id: int):
     return result.scalars().first()
 
 
-async def delete_like(db: AsyncSession, like_id: int):
-    await db.execute(delete(Like).where(Like.like_id == like_id))
-    await db.commit()
-    return
+async def get_my_likes_for_posts(db: AsyncSession, user_id: int, post_ids):
+    # SELECT post_id, like_id FROM likes WHERE user_id = :u AND post_id IN (...)  ->  {post_id: like_id}
+    result = await db.execute(
+        select(Like.post_id, Like.like_id).where(Like.user_id == user_id, Like.post_id.in_(post_ids))
+    )
+    return {post_id: like_id for post_id, like_id in result.all()}
+
@@ -1,13 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.post_entity import Post
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update, case, func
+from app.models import summary_job_model
 
-async def create_post(db: AsyncSession, user_id, title, content, summary, image_url, nickname):
+async def create_post(db: AsyncSession, user_id, title, content, summary, image_url, nickname, summary_status="done"):
     post = Post(
         user_id=user_id,
         title=title,
         content=content,
         summary=summary,
+        summary_status=summary_status,
         image_url=image_url,
         author_nickname=nickname,
         views=0,
@@ -15,6 +17,9 @@ async def create_post(db: AsyncSession, user_id, title, content, summary, image_
         likes=0,
     )
     db.add(post)
+    if summary_status == "pending":
+        await db.flush()
+        await summary_job_model.add_job(db, post.post_id)
     await db.commit()
     await db.refresh(post)
     return post
@@ -24,14 +29,81 @@ async def get_post_by_id(db: AsyncSession, post_id: int):
     return result.scalars().first()
 
 
-async def get_post_list_by_id(db: AsyncSession, cursor_id: int):
-    result = await db.execute(select(Post).where(Post.post_id > cursor_id).order_by(Post.post_id.asc()))
-    return result.scalars().all()
+async def get_post_detail_row(db: AsyncSession, post_id: int):
+    # 상세 응답에 필요한 컬럼만 행으로 읽는다
+    stmt = select(
+        Post.post_id,
+        Post.title,
+        Post.content,
+        Post.summary,
+        Post.summary_status,
+        Post.image_url,
+        Post.user_id,
+        Post.created_at,
+        Post.views,
+        Post.likes,
+        Post.comments_count,
+    ).where(Post.post_id == post_id)
+    result = await db.execute(stmt)
+    return result.first()
 
-async def update_post(db: AsyncSession, post, title, content, summary, image_url: str | None):
+
+async def get_post_page(db: AsyncSession, cursor_id: int | None, count: int, descending: bool = False):
+    # count + 1 개를 조회해서 다음 페이지 존재 여부(has_more)를 함께 판단
+    stmt = select(Post)
+    if descending:
+        if cursor_id is not None:
+            stmt = stmt.where(Post.post_id < cursor_id)
+        stmt = stmt.order_by(Post.post_id.desc())
+    else:
+        stmt = stmt.where(Post.post_id > (cursor_id or 0)).order_by(Post.post_id.asc())
+    result = await db.execute(stmt.limit(count + 1))
+    rows = result.scalars().all()
+    return rows[:count], len(rows) > count
+
+async def get_feed_cards(db: AsyncSession, count: int):
+    # 최신 게시글 창용: 목록 카드에 필요한 컬럼만 최신순으로 count 개 (본문 content 는 읽지 않는다)
+    stmt = (
+        select(
+            Post.post_id,
+            Post.user_id,
+            Post.title,
+            Post.author_nickname,
+            Post.created_at,
+            Post.summary,
+            Post.summary_status,
+            Post.views,
+            Post.comments_count,
+            Post.likes,
+        )
+        .order_by(Post.post_id.desc())
+        .limit(count + 1)
+    )
+    result = await db.execute(stmt)
+    rows = result.all()
+    return rows[:count], len(rows) > count
+
+async def get_post_range_stats(db: AsyncSession, floor: int):
+    # post_id >= floor 인 게시글의 최대 id 와 개수 (PK 범위 조회라 최신 게시글 창 크기만큼만 읽는다)
+    stmt = select(func.max(Post.post_id), func.count()).select_from(Post).where(Post.post_id >= floor)
+    result = await db.execute(stmt)
+    newest, count = result.one()
+    return newest, count
+
+async def update_post(db: AsyncSession, post, title, content, summary, image_url: str | None, summary_status="done"):
     post.title = title
     post.content = content
     post.summary = summary
+    post.summary_status = summary_status
+    post.image_url = image_url
+    if summary_status == "pending":
+        await summary_job_model.add_job(db, post.post_id)
+    await db.commit()
+    await db.refresh(post)
+    return post
+
+async def update_post_meta(db: AsyncSession, post, title, image_url: str | None):
+    post.title = title
     post.image_url = image_url
     await db.commit()
     await db.refresh(post)
@@ -42,26 +114,44 @@ async def delete_post(db: AsyncSession, post_id:int):
     await db.commit()
     return
 
-async def update_views(db: AsyncSession, post):
-    post.views = (post.views or 0) + 1
-    if post.views < 0:
-        post.views = 0
+async def add_views(db: AsyncSession, deltas: dict):
+    # UPDATE posts SET views = views + CASE post_id WHEN .. THEN .. END WHERE post_id IN (..)
+    if not deltas:
+        return
+    await db.execute(
+        update(Post)
+        .where(Post.post_id.in_(list(deltas)))
+        .values(views=Post.views + case(deltas, value=Post.post_id, else_=0))
+    )
     await db.commit()
-    await db.refresh(post)
-    return post
 
-async def update_likes(db: AsyncSession, post, count):
-    post.likes = (post.likes or 0) + count
-    if post.likes < 0:
-        post.likes = 0
-    await db.commit()
-    await db.refresh(post)
-    return post
+async def _add_counter(db: AsyncSession, post_id: int, column, delta: int):
+    # 커밋하지 않는다. 좋아요/댓글 insert, delete 와 같은 트랜잭션에서 호출한다.
+    # 읽고 더해서 쓰지 않고 UPDATE 한 문장으로 원자적으로 증감한다 (0 아래로는 내려가지 않음).
+    dialect = db.get_bind().dialect
+    if dialect.name == "mysql":
+        # LAST_INSERT_ID(expr) 로 감싸면 새 값이 OK 패킷의 insert id 로 돌아와서 SELECT 없이 읽을 수 있다
+        new_value = func.last_insert_id(func.greatest(column + delta, 0))
+    else:
+        new_value = case((column + delta < 0, 0), else_=column + delta)
+    stmt = update(Post).where(Post.post_id == post_id).values({column.key: new_value})
 
-async def update_comments_count(db: AsyncSession, post, count):
-    post.comments_count = (post.comments_count or 0) + count
-    if post.comments_count < 0:
-        post.comments_count = 0
-    await db.commit()
-    await db.refresh(post)
-    return post
\ No newline at end of file
+    if dialect.name == "mysql":
+        result = await db.execute(stmt)
+        return result.lastrowid if result.rowcount else None
+    if dialect.update_returning:
+        result = await db.execute(stmt.returning(column))
+        return result.scalar()
+    await db.execute(stmt)
+    result = await db.execute(select(column).where(Post.post_id == post_id))
+    return result.scalar()
+
+async def get_likes(db: AsyncSession, post_id: int):
+    result = await db.execute(select(Post.likes).where(Post.post_id == post_id))
+    return result.scalar()
+
+async def add_likes(db: AsyncSession, post_id: int, delta: int):
+    return await _add_counter(db, post_id, Post.likes, delta)
+
+async def add_comments_count(db: AsyncSession, post_id: int, delta: int):
+    return await _add_counter(db, post_id, Post.comments_count, delta)
@@ -0,0 +1,18 @@
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.entity.summary_cache_entity import SummaryCache
+
+
+async def get_summary(db: AsyncSession, content_hash: str):
+    result = await db.execute(select(SummaryCache.summary).where(SummaryCache.content_hash == content_hash))
+    return result.scalars().first()
+
+
+async def save_summary(db: AsyncSession, content_hash: str, summary: str):
+    db.add(SummaryCache(content_hash=content_hash, summary=summary))
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 다른 워커가 같은 본문을 먼저 저장한 경우
+        await db.rollback()
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from sqlalchemy import select, delete, update, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.entity.summary_job_entity import SummaryJob
+from app.entity.post_entity import Post
+
+
+async def add_job(db: AsyncSession, post_id: int):
+    # 커밋하지 않는다. 게시글 저장과 같은 트랜잭션에서 작업을 넣기 위함.
+    # 이미 대기 중인 작업이 있으면 새 작업으로 교체한다(수정이 연달아 와도 최신 내용만 요약).
+    await db.execute(delete(SummaryJob).where(SummaryJob.post_id == post_id))
+    db.add(SummaryJob(post_id=post_id, attempts=0, next_run_at=datetime.now()))
+
+
+async def claim_jobs(db: AsyncSession, limit: int, lock_timeout: timedelta):
+    # 실행할 작업을 잠그고 (job_id, post_id, content, attempts) 목록을 돌려준다.
+    # 잠근 뒤 오래 끝나지 않은 작업(프로세스가 죽은 경우)은 다시 가져간다.
+    now = datetime.now()
+    stmt = (
+        select(SummaryJob.job_id, SummaryJob.post_id, SummaryJob.attempts, Post.content)
+        .join(Post, Post.post_id == SummaryJob.post_id)
+        .where(
+            SummaryJob.next_run_at <= now,
+            or_(SummaryJob.locked_at.is_(None), SummaryJob.locked_at < now - lock_timeout),
+        )
+        .order_by(SummaryJob.job_id.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=SummaryJob)
+    )
+    rows = (await db.execute(stmt)).all()
+    if rows:
+        await db.execute(
+            update(SummaryJob)
+            .where(SummaryJob.job_id.in_([r.job_id for r in rows]))
+            .values(locked_at=now)
+        )
+    await db.commit()
+    return rows
+
+
+async def complete_job(db: AsyncSession, job_id: int, post_id: int, summary: str):
+    # 처리 중에 게시글이 다시 수정되면 작업이 새로 교체되므로 삭제가 0건이 되고, 오래된 요약은 버린다.
+    result = await db.execute(delete(SummaryJob).where(SummaryJob.job_id == job_id))
+    if result.rowcount:
+        await db.execute(
+            update(Post)
+            .where(Post.post_id == post_id)
+            .values(summary=summary, summary_status="done")
+        )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def fail_job(db: AsyncSession, job_id: int, post_id: int, attempts: int, error: str, max_attempts: int, retry_delay: timedelta):
+    # 재시도 횟수를 넘겨서 게시글을 failed 로 바꿨으면 True
+    failed = False
+    if attempts >= max_attempts:
+        result = await db.execute(delete(SummaryJob).where(SummaryJob.job_id == job_id))
+        if result.rowcount:
+            await db.execute(update(Post).where(Post.post_id == post_id).values(summary_status="failed"))
+            failed = True
+    else:
+        await db.execute(
+            update(SummaryJob)
+            .where(SummaryJob.job_id == job_id)
+            .values(
+                attempts=attempts,
+                last_error=error[:255],
+                locked_at=None,
+                next_run_at=datetime.now() + retry_delay,
+            )
+        )
+    await db.commit()
+    return failed
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.entity.user_entity import User
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 async def create_user(db: AsyncSession, email: str, password: str, nickname: str, profile_image: str | None):
     user = User(
@@ -29,12 +29,12 @@ async def get_user_by_id(db: AsyncSession, user_id: int):
     result = await db.execute(stmt)
     return result.scalars().first()
 
-async def update_user_profile(db: AsyncSession, user: User, nickname: str, profile_image: str | None):
-    user.nickname = nickname
-    user.profile_image = profile_image
+async def update_user_profile(db: AsyncSession, user_id: int, nickname: str, profile_image: str | None):
+    # SELECT 없이 바로 UPDATE 하고 바뀐 행 수를 돌려준다 (0 이면 그 사이 탈퇴한 사용자)
+    stmt = update(User).where(User.user_id == user_id).values(nickname=nickname, profile_image=profile_image)
+    result = await db.execute(stmt)
     await db.commit()
-    await db.refresh(user)
-    return user
+    return result.rowcount
 
 async def update_user_password(db: AsyncSession, user: User, new_password: str):
     user.password = new_password
@@ -48,3 +48,10 @@ async def delete_user(db: AsyncSession, user_id: int):
         return
     await db.delete(user)
     await db.commit()
+
+async def get_users_by_ids(db: AsyncSession, user_ids):
+    if not user_ids:
+        return []
+    stmt = select(User).where(User.user_id.in_(user_ids))
+    result = await db.execute(stmt)
+    return result.scalars().all()
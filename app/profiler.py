@@ -0,0 +1,124 @@
+import os
+import re
+import json
+import time
+import contextvars
+from functools import lru_cache
+from sqlalchemy import event
+
+# 개발/스테이징용: 요청마다 실행한 SQL 을 세고 시간을 재서 응답 헤더와 로그 한 줄로 남긴다.
+# 같은 모양의 SQL 이 threshold 번 이상 반복되면 N+1 로 표시한다.
+SQL_PROFILE = os.getenv("SQL_PROFILE", "0") == "1"
+SQL_PROFILE_N1_THRESHOLD = int(os.getenv("SQL_PROFILE_N1_THRESHOLD", "5"))
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES = re.compile(r"(\(\s*\?(?:\s*,\s*\?)*\s*\))(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    # 값과 바인드 파라미터를 ? 로 바꾸고 IN 목록, 여러 행 VALUES 를 하나로 접는다
+    shape = _STRING.sub("?", statement)
+    shape = _PARAM.sub("?", shape)
+    shape = _NUMBER.sub("?", shape)
+    shape = _IN_LIST.sub("IN (...)", shape)
+    shape = _VALUES.sub(r"\1, ...", shape)
+    return _SPACE.sub(" ", shape).strip()
+
+
+class SqlProfile:
+    __slots__ = ("queries", "total", "shapes")
+
+    def __init__(self):
+        self.queries = 0
+        self.total = 0.0
+        self.shapes: dict[str, list] = {}  # shape -> [횟수, 시간]
+
+    def record(self, statement: str, elapsed: float):
+        self.queries += 1
+        self.total += elapsed
+        entry = self.shapes.get(statement)
+        if entry is None:
+            entry = self.shapes[statement] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += elapsed
+
+    def suspects(self, threshold: int) -> list[dict]:
+        # 모양별로 합친 뒤 threshold 번 이상 반복된 것
+        grouped: dict[str, list] = {}
+        for statement, (count, elapsed) in self.shapes.items():
+            entry = grouped.setdefault(normalize_sql(statement), [0, 0.0])
+            entry[0] += count
+            entry[1] += elapsed
+        return [
+            {"count": count, "ms": round(elapsed * 1000, 2), "sql": shape}
+            for shape, (count, elapsed) in sorted(grouped.items(), key=lambda kv: -kv[1][0])
+            if count >= threshold
+        ]
+
+
+_profile: contextvars.ContextVar[SqlProfile | None] = contextvars.ContextVar("sql_profile", default=None)
+
+
+def profile_engine(engine):
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _profile.get() is not None:
+            conn.info["sql_profile_start"] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        profile = _profile.get()
+        start = conn.info.pop("sql_profile_start", None)
+        if profile is not None and start is not None:
+            profile.record(statement, time.perf_counter() - start)
+
+
+class SqlProfilerMiddleware:
+    def __init__(self, app, n1_threshold: int = SQL_PROFILE_N1_THRESHOLD):
+        self.app = app
+        self.n1_threshold = n1_threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = SqlProfile()
+        token = _profile.set(profile)
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # 응답 헤더가 나가는 시점까지 실행한 SQL 기준
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-queries", str(profile.queries).encode()))
+                headers.append((b"x-db-time", f"{profile.total * 1000:.2f}".encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _profile.reset(token)
+            suspects = profile.suspects(self.n1_threshold)
+            route = getattr(scope.get("route"), "path", None)
+            line = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route,
+                "status": status,
+                "queries": profile.queries,
+                "db_ms": round(profile.total * 1000, 2),
+            }
+            if suspects:
+                line["n_plus_one"] = suspects
+            print("[sql-profile]", json.dumps(line, ensure_ascii=False))
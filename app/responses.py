@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any
+import orjson
+from fastapi.responses import JSONResponse
+
+# 응답 직렬화는 orjson 으로 한다. app/schemas 의 dataclass 는 dict 로 바꾸지 않고 그대로 인코딩된다.
+# 날짜는 기존 응답과 같은 "YYYY-MM-DD HH:MM:SS" 형식으로 내보낸다.
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any, sort_keys: bool = False) -> bytes:
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(content, default=_default, option=option)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..controllers import comment_controller as cc
-from app.db import get_db
+from app.schemas.comment_schema import CommentListResponse
+from app.db import get_db, get_read_db
+from app.auth import AuthUser, current_user
 
 router = APIRouter()
 
 @router.post("/comment")
-async def create_comment(request: Request, db: AsyncSession = Depends(get_db)):
-    return await cc.create_comment(request, db)
+async def create_comment(
+    request: Request, db: AsyncSession = Depends(get_db), me: AuthUser | None = Depends(current_user)
+):
+    return await cc.create_comment(request, db, me)
 
 @router.put("/comment/{comment_id}")
 async def update_comment(comment_id: int, request: Request, db: AsyncSession = Depends(get_db)):
@@ -16,3 +20,7 @@ async def update_comment(comment_id: int, request: Request, db: AsyncSession = D
 @router.delete("/comment/{comment_id}")
 async def delete_comment(comment_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await cc.delete_comment(comment_id, request, db)
+
+@router.get("/posts/{post_id}/comments", responses={200: {"model": CommentListResponse}})
+async def list_comments(post_id: int, request: Request, after: int = 0, limit: int = 20, db: AsyncSession = Depends(get_read_db)):
+    return await cc.list_comments(post_id, after, limit, request, db)
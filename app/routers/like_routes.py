@@ -12,3 +12,11 @@ async def create_like(request: Request, db: AsyncSession = Depends(get_db)):
 @router.delete("/like/{like_id}")
 async def delete_like(like_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await lc.delete_like(like_id, request, db)
+
+@router.put("/posts/{post_id}/like")
+async def like_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    return await lc.like_post(post_id, request, db)
+
+@router.delete("/posts/{post_id}/like")
+async def unlike_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    return await lc.unlike_post(post_id, request, db)
@@ -1,24 +1,28 @@
 from fastapi import APIRouter, Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..controllers import post_controller as pc
-from app.db import get_db
+from app.schemas.post_schema import PostListResponse, PostDetailResponse
+from app.db import get_db, get_read_db
+from app.auth import AuthUser, current_user
 
 router = APIRouter()
 
-@router.get("/posts")
-async def list_posts(cursor_id: int, count: int, db: AsyncSession = Depends(get_db)):
-    return await pc.list_posts(cursor_id, count, db)
+@router.get("/posts", responses={200: {"model": PostListResponse}})
+async def list_posts(request: Request, count: int, cursor_id: int = 0, before: int | None = None, order: str = "asc", db: AsyncSession = Depends(get_read_db)):
+    return await pc.list_posts(cursor_id, count, before, order, request, db)
 
 @router.post("/posts")
-async def create_post(request: Request, db: AsyncSession = Depends(get_db)):
-    return await pc.create_post(request, db)
+async def create_post(
+    request: Request, db: AsyncSession = Depends(get_db), me: AuthUser | None = Depends(current_user)
+):
+    return await pc.create_post(request, db, me)
 
 @router.put("/posts/{post_id}")
 async def update_post(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
     return await pc.update_post(post_id, request, db)
 
-@router.get("/posts/{post_id}")
-async def get_post_detail(post_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+@router.get("/posts/{post_id}", responses={200: {"model": PostDetailResponse}})
+async def get_post_detail(post_id: int, request: Request, db: AsyncSession = Depends(get_read_db)):
     return await pc.get_post_detail(post_id, request, db)
 
 @router.delete("/posts/{post_id}")
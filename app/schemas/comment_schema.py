@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+# 응답 스키마는 slots dataclass 로 둔다: orjson 이 dict 변환 없이 바로 인코딩하고, OpenAPI 문서에도 그대로 쓰인다.
+
+
+@dataclass(slots=True)
+class CommentItem:
+    comment_id: int
+    content: str
+    author_nickname: str
+    author_profile_image: str | None
+    created_at: datetime | None
+    user_id: int
+
+
+@dataclass(slots=True)
+class CommentList:
+    comments: list[CommentItem]
+    next_cursor: int
+    has_more: bool
+
+
+@dataclass(slots=True)
+class CommentListResponse:
+    detail: str
+    data: CommentList
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from datetime import datetime
+from .comment_schema import CommentItem
+
+
+@dataclass(slots=True)
+class PostCard:
+    post_id: int
+    title: str
+    author_nickname: str
+    author_profile_image: str | None
+    created_at: datetime | None
+    summary: str | None
+    summary_status: str
+    views: int
+    comments_count: int
+    likes: int
+    is_liked_by_me: bool
+    like_id: int | None
+
+
+@dataclass(slots=True)
+class PostList:
+    post_list: list[PostCard]
+    next_cursor: int | None
+    has_more: bool
+
+
+@dataclass(slots=True)
+class PostListResponse:
+    detail: str
+    data: PostList
+
+
+@dataclass(slots=True)
+class PostDetail:
+    post_id: int
+    title: str
+    content: str
+    summary: str | None
+    summary_status: str
+    image_url: str | None
+    author_nickname: str
+    author_user_id: int
+    created_at: datetime | None
+    updated_at: datetime | None
+    views: int
+    likes: int
+    comments_count: int
+    comments: list[CommentItem]
+    comments_next_cursor: int
+    comments_has_more: bool
+    is_liked_by_me: bool
+    like_id: int | None
+
+
+@dataclass(slots=True)
+class PostDetailResponse:
+    detail: str
+    data: PostDetail
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class LoginData:
+    user_id: int
+    profile_img_url: str | None
+    profile_nickname: str
+    session_id: str
+
+
+@dataclass(slots=True)
+class LoginResponse:
+    detail: str
+    data: LoginData
+
+
+@dataclass(slots=True)
+class ProfileData:
+    user_id: int
+    nickname: str
+    profile_image: str | None
+
+
+@dataclass(slots=True)
+class ProfileResponse:
+    detail: str
+    data: ProfileData
@@ -0,0 +1,159 @@
+import os
+import threading
+from .chunking import split_into_chunks, truncate_tokens
+
+MODEL_PATH = "./ai/kobart-summary-v3"
+INFERENCE_MODES = ("fp32", "int8")
+
+# fp32: 기본 / int8: Linear 레이어 동적 양자화 (CPU 전용 노드에서 처리량 우선)
+SUMMARY_INFERENCE_MODE = os.getenv("SUMMARY_INFERENCE_MODE", "fp32")
+SUMMARY_NUM_THREADS = int(os.getenv("SUMMARY_NUM_THREADS", "0"))  # 0 이면 torch 기본값
+SUMMARY_INTEROP_THREADS = int(os.getenv("SUMMARY_INTEROP_THREADS", "0"))
+SUMMARY_NUM_BEAMS = int(os.getenv("SUMMARY_NUM_BEAMS", "0"))  # 0 이면 모델 generation_config 값, 1 이면 greedy
+SUMMARY_MAX_LENGTH = int(os.getenv("SUMMARY_MAX_LENGTH", "200"))
+
+# 긴 본문 처리: 문장 단위로 SUMMARY_CHUNK_TOKENS 이하 청크로 나눠 요약한 뒤, 부분 요약을 합쳐 다시 요약한다
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "512"))
+SUMMARY_MAX_INPUT_TOKENS = int(os.getenv("SUMMARY_MAX_INPUT_TOKENS", "4096"))  # 이보다 긴 본문은 뒷부분을 버린다
+SUMMARY_CHUNK_BATCH_SIZE = int(os.getenv("SUMMARY_CHUNK_BATCH_SIZE", "8"))  # generate 한 번에 넣는 최대 청크 수
+SUMMARY_MAX_REDUCE_ROUNDS = 2
+
+
+def configure_threads(num_threads: int, interop_threads: int):
+    import torch
+
+    if num_threads > 0:
+        torch.set_num_threads(num_threads)
+    if interop_threads > 0:
+        try:
+            torch.set_num_interop_threads(interop_threads)
+        except RuntimeError:
+            # 이미 병렬 작업이 한 번 실행된 뒤에는 바꿀 수 없다
+            print("[summary-backend] interop threads already initialized, keeping", torch.get_num_interop_threads())
+
+
+class SummaryBackend:
+    def __init__(
+        self,
+        model_path: str,
+        mode: str,
+        num_threads: int,
+        interop_threads: int,
+        num_beams: int,
+        max_length: int,
+        chunk_tokens: int = SUMMARY_CHUNK_TOKENS,
+        max_input_tokens: int = SUMMARY_MAX_INPUT_TOKENS,
+        chunk_batch_size: int = SUMMARY_CHUNK_BATCH_SIZE,
+    ):
+        if mode not in INFERENCE_MODES:
+            raise ValueError(f"unknown SUMMARY_INFERENCE_MODE: {mode}")
+        self.model_path = model_path
+        self.mode = mode
+        self.num_threads = num_threads
+        self.interop_threads = interop_threads
+        self.num_beams = num_beams
+        self.max_length = max_length
+        self.chunk_tokens = chunk_tokens
+        self.max_input_tokens = max_input_tokens
+        self.chunk_batch_size = max(1, chunk_batch_size)
+        self._chunk_limit = chunk_tokens
+        self.tokenizer = None
+        self.model = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.model is not None
+
+    def ensure_loaded(self):
+        if self.model is not None:
+            return
+        with self._load_lock:
+            if self.model is None:
+                self.load()
+
+    def load(self):
+        # torch / transformers 는 import 자체가 무거워서 실제로 모델을 올릴 때 가져온다
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+        configure_threads(self.num_threads, self.interop_threads)
+        tokenizer = AutoTokenizer.from_pretrained(self.model_path)
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_path)
+        model.eval()
+        if self.mode == "int8":
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        # 모델 위치 임베딩 한도를 넘지 않게 (special token 2개 자리 확보)
+        model_limit = getattr(model.config, "max_position_embeddings", None)
+        self._chunk_limit = min(self.chunk_tokens, model_limit - 2) if model_limit else self.chunk_tokens
+        self.tokenizer = tokenizer
+        self.model = model
+
+    def generate_kwargs(self) -> dict:
+        kwargs = {"max_length": self.max_length}
+        if self.num_beams > 0:
+            kwargs["num_beams"] = self.num_beams
+            if self.num_beams > 1:
+                kwargs["early_stopping"] = True
+        return kwargs
+
+    def config_key(self) -> str:
+        # 요약 캐시 키에 들어간다. 결과에 영향을 주는 설정만 넣는다.
+        beams = self.num_beams or "default"
+        return (
+            f"{self.model_path}|{self.mode}|beams={beams}|max_length={self.max_length}"
+            f"|chunk={self.chunk_tokens}|max_input={self.max_input_tokens}"
+        )
+
+    def generate(self, contents: list[str]) -> list[str]:
+        self.ensure_loaded()
+        contents = [truncate_tokens(self.tokenizer, c, self.max_input_tokens) for c in contents]
+        return self._summarize(contents, 0)
+
+    def _summarize(self, texts: list[str], depth: int) -> list[str]:
+        # 마지막 라운드에서는 청크를 하나로 제한(잘라냄)해서 반드시 끝나게 한다
+        max_chunks = 1 if depth >= SUMMARY_MAX_REDUCE_ROUNDS else self.max_input_tokens // self._chunk_limit + 1
+        chunked = [split_into_chunks(self.tokenizer, t, self._chunk_limit, max_chunks) for t in texts]
+        flat = [chunk for chunks in chunked for chunk in chunks]
+
+        partials = []
+        for start in range(0, len(flat), self.chunk_batch_size):
+            partials.extend(self._generate_batch(flat[start:start + self.chunk_batch_size]))
+
+        merged = []
+        pos = 0
+        for chunks in chunked:
+            parts = partials[pos:pos + len(chunks)]
+            pos += len(chunks)
+            merged.append(" ".join(parts))
+
+        # 여러 청크로 나뉜 본문은 부분 요약을 이어 붙여 한 번 더 요약 (그래도 길면 다시 나눈다)
+        reduce_idx = [i for i, chunks in enumerate(chunked) if len(chunks) > 1]
+        if reduce_idx:
+            reduced = self._summarize([merged[i] for i in reduce_idx], depth + 1)
+            for i, summary in zip(reduce_idx, reduced):
+                merged[i] = summary
+        return merged
+
+    def _generate_batch(self, chunks: list[str]) -> list[str]:
+        import torch
+
+        inputs = self.tokenizer(
+            chunks, return_tensors="pt", padding=True, truncation=True, max_length=self._chunk_limit + 2
+        )
+        with torch.inference_mode():
+            summary_ids = self.model.generate(**inputs, **self.generate_kwargs())
+        return self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+
+    def close(self):
+        pass
+
+
+summary_backend = SummaryBackend(
+    MODEL_PATH,
+    SUMMARY_INFERENCE_MODE,
+    SUMMARY_NUM_THREADS,
+    SUMMARY_INTEROP_THREADS,
+    SUMMARY_NUM_BEAMS,
+    SUMMARY_MAX_LENGTH,
+)
@@ -0,0 +1,55 @@
+import os
+import hashlib
+import traceback
+from app.cache import LRUCache
+from app.db import AsyncSessionLocal
+from app.models import summary_cache_model
+
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1024"))
+SUMMARY_CACHE_PERSIST = os.getenv("SUMMARY_CACHE_PERSIST", "1") == "1"
+
+
+def normalize_content(content: str) -> str:
+    return " ".join(content.split())
+
+
+def make_cache_key(content: str, config_key: str) -> str:
+    # 모델/생성 설정이 바뀌면 다른 요약이 나오므로 설정값도 키에 포함한다
+    raw = f"{config_key}\0{normalize_content(content)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class TieredSummaryCache:
+    # 1단계: 프로세스 메모리 LRU / 2단계: summary_cache 테이블
+    def __init__(self, maxsize: int, persist: bool):
+        self._memory = LRUCache(maxsize)
+        self.persist = persist
+
+    async def get(self, key: str):
+        summary = self._memory.get(key)
+        if summary is not None or not self.persist:
+            return summary
+        try:
+            async with AsyncSessionLocal() as db:
+                summary = await summary_cache_model.get_summary(db, key)
+        except Exception as e:
+            # 캐시 조회 실패는 요약 생성으로 넘어가면 되므로 에러로 올리지 않는다
+            print("[summary-cache] lookup failed:", repr(e))
+            return None
+        if summary is not None:
+            self._memory.set(key, summary)
+        return summary
+
+    async def set(self, key: str, summary: str):
+        self._memory.set(key, summary)
+        if not self.persist:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                await summary_cache_model.save_summary(db, key, summary)
+        except Exception as e:
+            print("[summary-cache] save failed:", repr(e))
+            traceback.print_exc()
+
+
+summary_cache = TieredSummaryCache(SUMMARY_CACHE_SIZE, SUMMARY_CACHE_PERSIST)
@@ -0,0 +1,53 @@
+import re
+
+# 문장 끝 부호 뒤의 공백이나 줄바꿈에서 자른다
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+
+def split_sentences(text: str) -> list[str]:
+    return [s.strip() for s in SENTENCE_BOUNDARY.split(text) if s and s.strip()]
+
+
+def truncate_tokens(tokenizer, text: str, max_tokens: int) -> str:
+    ids = tokenizer.encode(text, add_special_tokens=False)
+    if len(ids) <= max_tokens:
+        return text
+    return tokenizer.decode(ids[:max_tokens], skip_special_tokens=True)
+
+
+def split_into_chunks(tokenizer, text: str, chunk_tokens: int, max_chunks: int) -> list[str]:
+    # 문장 단위로 chunk_tokens 를 넘지 않게 묶는다. 한 문장이 chunk_tokens 보다 길면 토큰 기준으로 자른다.
+    # max_chunks 를 넘는 뒷부분은 버려서 요청 하나의 최악 지연/메모리를 제한한다.
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            chunks.append(" ".join(current))
+        current = []
+        current_tokens = 0
+
+    for sentence in split_sentences(text):
+        ids = tokenizer.encode(sentence, add_special_tokens=False)
+        if len(ids) > chunk_tokens:
+            flush()
+            tail = len(ids) - len(ids) % chunk_tokens
+            for start in range(0, tail, chunk_tokens):
+                chunks.append(tokenizer.decode(ids[start:start + chunk_tokens], skip_special_tokens=True))
+                if len(chunks) >= max_chunks:
+                    return chunks[:max_chunks]
+            # 남은 조각은 다음 문장들과 같은 청크로 묶는다
+            ids = ids[tail:]
+            if not ids:
+                continue
+            sentence = tokenizer.decode(ids, skip_special_tokens=True)
+        if current_tokens + len(ids) > chunk_tokens:
+            flush()
+            if len(chunks) >= max_chunks:
+                return chunks[:max_chunks]
+        current.append(sentence)
+        current_tokens += len(ids)
+    flush()
+    return chunks[:max_chunks] or [text]
@@ -0,0 +1,97 @@
+import asyncio
+import itertools
+from .protocol import encode_frame, read_frame
+
+
+class SidecarError(Exception):
+    pass
+
+
+class SidecarClient:
+    # 요약 사이드카(app.summary.sidecar)에 Unix 소켓 연결 하나를 유지하면서 요청을 id 로 다중화한다.
+    # SummaryBackend 와 같은 인터페이스(ensure_loaded / generate / config_key)를 비동기로 제공한다.
+    def __init__(self, socket_path: str, timeout_sec: float, config_key: str):
+        self.socket_path = socket_path
+        self.timeout = timeout_sec
+        self._config_key = config_key
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock: asyncio.Lock | None = None
+        self._ready = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._ready
+
+    def config_key(self) -> str:
+        return self._config_key
+
+    async def ensure_loaded(self):
+        response = await self._request({"op": "ready"})
+        self._ready = bool(response.get("ready"))
+
+    async def generate(self, contents: list[str]) -> list[str]:
+        response = await self._request({"op": "summarize", "contents": contents})
+        if "error" in response:
+            raise SidecarError(response["error"])
+        self._ready = True
+        return response["summaries"]
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._read_task is not None:
+            self._read_task.cancel()
+        self._reader = self._writer = self._read_task = None
+        self._connect_lock = None
+        self._ready = False
+
+    async def _connect(self):
+        if self._writer is not None and not self._writer.is_closing():
+            return
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self.socket_path), self.timeout
+            )
+            self._read_task = asyncio.create_task(self._read_loop(self._reader))
+
+    async def _read_loop(self, reader: asyncio.StreamReader):
+        try:
+            while True:
+                message = await read_frame(reader)
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 연결이 끊기면 기다리던 요청을 모두 실패시키고, 다음 요청 때 다시 연결한다
+            self._ready = False
+            if self._writer is not None:
+                self._writer.close()
+            self._writer = None
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(SidecarError(f"connection_lost: {e!r}"))
+
+    async def _request(self, message: dict) -> dict:
+        await self._connect()
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(encode_frame({**message, "id": request_id}))
+            await self._writer.drain()
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise SidecarError("timeout")
+        finally:
+            self._pending.pop(request_id, None)
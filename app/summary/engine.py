@@ -0,0 +1,184 @@
+import os
+import time
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from app.metrics import Gauge, SUMMARY_GENERATION, SUMMARY_BATCH_SIZE
+from .backend import summary_backend
+from .client import SidecarClient
+from .cache import summary_cache, make_cache_key
+
+SUMMARY_MAX_BATCH_SIZE = int(os.getenv("SUMMARY_MAX_BATCH_SIZE", "8"))
+SUMMARY_MAX_WAIT_MS = int(os.getenv("SUMMARY_MAX_WAIT_MS", "20"))
+SUMMARY_PRELOAD = os.getenv("SUMMARY_PRELOAD", "1") == "1"  # 0 이면 첫 요약 요청 때 모델을 올린다
+SUMMARY_WARMUP = os.getenv("SUMMARY_WARMUP", "1") == "1"
+SUMMARY_SIDECAR_SOCKET = os.getenv("SUMMARY_SIDECAR_SOCKET")  # 설정하면 모델을 직접 올리지 않고 사이드카에 요청
+SUMMARY_SIDECAR_TIMEOUT_SEC = float(os.getenv("SUMMARY_SIDECAR_TIMEOUT_SEC", "30"))
+SUMMARY_READY_PROBE_SEC = float(os.getenv("SUMMARY_READY_PROBE_SEC", "5"))
+WARMUP_TEXT = "서버 시작 시 모델을 미리 한 번 실행해서 첫 요청의 지연을 줄인다."
+
+
+class SummaryEngine:
+    # 동시에 들어온 요약 요청을 max_wait_ms 동안 모아서 padding 된 배치 하나로 generate 한다.
+    # generate 는 전용 스레드에서 돌기 때문에 이벤트 루프는 막히지 않는다.
+    # 같은 본문은 캐시에서 바로 돌려주고, 동시에 들어온 같은 본문은 한 번만 생성한다.
+    def __init__(self, backend, max_batch_size: int, max_wait_ms: int, cache=None):
+        self.backend = backend
+        self.cache = cache
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._probe_task: asyncio.Task | None = None
+        self._probed_at = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.backend.loaded
+
+    @property
+    def queue_depth(self) -> int:
+        # 배치에 들어가길 기다리는 요청 수
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def preload(self, warmup: bool):
+        # lifespan 에서 백그라운드로 호출한다. 로딩은 전용 스레드에서 하므로 서버는 바로 요청을 받는다.
+        try:
+            await self._call(self.backend.ensure_loaded)
+            if warmup:
+                await self._call(self.backend.generate, [WARMUP_TEXT])
+        except Exception as e:
+            print("[summary-engine] preload failed:", repr(e))
+            traceback.print_exc()
+
+    def probe_ready(self):
+        # 사이드카가 API 보다 늦게 뜨거나(연결 실패), 아직 모델을 올리는 중이거나(ready: false), 재시작되면
+        # preload 한 번으로는 준비 상태를 알 수 없다. /health 에서 부르면 준비 안 된 동안만
+        # SUMMARY_READY_PROBE_SEC 마다 한 번 백그라운드로 ready 를 다시 물어본다.
+        # 로컬 모델은 다시 물어보는 게 곧 모델 로딩이라 비동기(사이드카) 백엔드만 대상으로 한다.
+        if self.ready or not asyncio.iscoroutinefunction(self.backend.ensure_loaded):
+            return
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+        now = time.monotonic()
+        if now - self._probed_at < SUMMARY_READY_PROBE_SEC:
+            return
+        self._probed_at = now
+        self._probe_task = asyncio.create_task(self._probe())
+
+    async def _probe(self):
+        try:
+            await self.backend.ensure_loaded()
+        except Exception as e:
+            print("[summary-engine] ready probe failed:", repr(e))
+
+    async def summarize(self, content: str) -> str:
+        if self.cache is None:
+            return await self._submit(content)
+
+        key = make_cache_key(content, self.backend.config_key())
+        summary = await self.cache.get(key)
+        if summary is not None:
+            return summary
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._summarize_and_store(key, content))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _summarize_and_store(self, key: str, content: str) -> str:
+        summary = await self._submit(content)
+        await self.cache.set(key, summary)
+        return summary
+
+    async def _submit(self, content: str) -> str:
+        if asyncio.iscoroutinefunction(self.backend.generate):
+            # 사이드카는 요청 id 로 다중화하고 배치도 자기 쪽에서 묶으므로, 여기서 또 모으지 않고 바로 보낸다
+            # (워커 하나가 배치 하나씩 기다리면 워커당 요청이 하나만 나가고 대기 시간도 두 번 든다)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            summaries = await self.backend.generate([content])
+            SUMMARY_GENERATION.observe(loop.time() - started)
+            return summaries[0]
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((content, future))
+        return await future
+
+    async def _call(self, fn, *args):
+        # 로컬 모델은 전용 스레드에서, 사이드카 클라이언트는 이벤트 루프에서 바로 실행
+        if asyncio.iscoroutinefunction(fn):
+            return await fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+        return self._executor
+
+    def _ensure_worker(self):
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run(self._queue))
+
+    async def _run(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 기다리는 동안 취소된 요청은 배치에서 뺀다
+            batch = [(content, future) for content, future in batch if not future.done()]
+            if not batch:
+                continue
+            started = loop.time()
+            try:
+                summaries = await self._call(self.backend.generate, [c for c, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            SUMMARY_GENERATION.observe(loop.time() - started)
+            SUMMARY_BATCH_SIZE.observe(len(batch))
+            for (_, future), summary in zip(batch, summaries):
+                if not future.done():
+                    future.set_result(summary)
+
+    async def close(self):
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        if asyncio.iscoroutinefunction(self.backend.close):
+            await self.backend.close()
+        else:
+            self.backend.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+if SUMMARY_SIDECAR_SOCKET:
+    # 캐시 키는 API 워커와 사이드카가 같은 .env 설정을 쓴다는 전제로 로컬 설정값을 사용한다
+    _backend = SidecarClient(SUMMARY_SIDECAR_SOCKET, SUMMARY_SIDECAR_TIMEOUT_SEC, summary_backend.config_key())
+else:
+    _backend = summary_backend
+
+summary_engine = SummaryEngine(_backend, SUMMARY_MAX_BATCH_SIZE, SUMMARY_MAX_WAIT_MS, cache=summary_cache)
+
+Gauge("summary_queue_depth", "Summary requests waiting for a batch", (), lambda: [((), summary_engine.queue_depth)])
+Gauge("summary_inflight", "Distinct summaries being generated", (), lambda: [((), len(summary_engine._inflight))])
@@ -0,0 +1,97 @@
+import os
+import asyncio
+import traceback
+from datetime import timedelta
+from app.db import AsyncSessionLocal
+from app.models import summary_job_model
+from app.detail_cache import post_detail_cache
+from app.feed_window import feed_window
+from .engine import summary_engine, SUMMARY_MAX_BATCH_SIZE
+
+# sync: 요청 안에서 요약까지 끝낸 뒤 응답 / async: summary 없이 바로 저장하고 작업 큐에 넣는다
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "sync")
+SUMMARY_JOB_POLL_MS = int(os.getenv("SUMMARY_JOB_POLL_MS", "1000"))
+SUMMARY_JOB_MAX_ATTEMPTS = int(os.getenv("SUMMARY_JOB_MAX_ATTEMPTS", "3"))
+SUMMARY_JOB_LOCK_TIMEOUT = timedelta(seconds=int(os.getenv("SUMMARY_JOB_LOCK_TIMEOUT_SEC", "300")))
+
+
+def is_async_mode() -> bool:
+    return SUMMARY_MODE == "async"
+
+
+class SummaryJobWorker:
+    # summary_jobs 테이블을 주기적으로 비우면서 요약을 만들어 게시글에 다시 쓴다.
+    # 작업은 DB 에 남아 있으므로 서버가 재시작되어도 사라지지 않는다.
+    def __init__(self, poll_ms: int, batch_size: int, max_attempts: int, lock_timeout: timedelta):
+        self.poll_interval = poll_ms / 1000
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.lock_timeout = lock_timeout
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self):
+        # 같은 프로세스에서 작업을 넣었으면 폴링 주기를 기다리지 않고 바로 깨운다
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                processed = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print("[summary-worker] unexpected error:", repr(e))
+                traceback.print_exc()
+                processed = 0
+            if processed:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def run_once(self) -> int:
+        async with AsyncSessionLocal() as db:
+            jobs = await summary_job_model.claim_jobs(db, self.batch_size, self.lock_timeout)
+        if not jobs:
+            return 0
+
+        # 한 번에 요청해야 엔진에서 하나의 배치로 묶인다
+        results = await asyncio.gather(
+            *[summary_engine.summarize(job.content) for job in jobs],
+            return_exceptions=True,
+        )
+        async with AsyncSessionLocal() as db:
+            for job, result in zip(jobs, results):
+                if isinstance(result, BaseException):
+                    attempts = job.attempts + 1
+                    delay = timedelta(seconds=2 ** attempts)
+                    failed = await summary_job_model.fail_job(
+                        db, job.job_id, job.post_id, attempts, repr(result), self.max_attempts, delay
+                    )
+                    if failed:
+                        feed_window.set_summary(job.post_id, None, "failed")
+                elif await summary_job_model.complete_job(db, job.job_id, job.post_id, result):
+                    feed_window.set_summary(job.post_id, result, "done")
+                post_detail_cache.invalidate(job.post_id)
+        return len(jobs)
+
+
+summary_worker = SummaryJobWorker(
+    SUMMARY_JOB_POLL_MS, SUMMARY_MAX_BATCH_SIZE, SUMMARY_JOB_MAX_ATTEMPTS, SUMMARY_JOB_LOCK_TIMEOUT
+)
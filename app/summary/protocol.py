@@ -0,0 +1,27 @@
+import json
+import struct
+import asyncio
+
+# 프레임 = 4바이트 big-endian 길이 + UTF-8 JSON 본문
+HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def encode_frame(message: dict) -> bytes:
+    body = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError("frame_too_large")
+    return HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict:
+    header = await reader.readexactly(HEADER.size)
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ProtocolError("frame_too_large")
+    body = await reader.readexactly(size)
+    return json.loads(body.decode("utf-8"))
@@ -0,0 +1,77 @@
+import os
+import argparse
+import asyncio
+import traceback
+from .backend import summary_backend
+from .engine import SummaryEngine, SUMMARY_MAX_BATCH_SIZE, SUMMARY_MAX_WAIT_MS, SUMMARY_WARMUP
+from .protocol import encode_frame, read_frame
+
+# 모델을 한 번만 올려두고 모든 uvicorn 워커의 요약 요청을 받아서 처리하는 프로세스
+#   python -m app.summary.sidecar --socket /tmp/community-summary.sock
+# API 워커는 SUMMARY_SIDECAR_SOCKET 을 같은 경로로 설정하면 된다.
+
+
+async def handle_connection(engine: SummaryEngine, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    write_lock = asyncio.Lock()
+    tasks = set()
+
+    async def respond(message: dict):
+        request_id = message.get("id")
+        try:
+            op = message.get("op")
+            if op == "ready":
+                response = {"id": request_id, "ready": engine.ready}
+            elif op == "summarize":
+                summaries = await asyncio.gather(*[engine.summarize(c) for c in message["contents"]])
+                response = {"id": request_id, "summaries": summaries}
+            else:
+                response = {"id": request_id, "error": "unknown_op"}
+        except Exception as e:
+            traceback.print_exc()
+            response = {"id": request_id, "error": repr(e)}
+        async with write_lock:
+            writer.write(encode_frame(response))
+            await writer.drain()
+
+    try:
+        while True:
+            message = await read_frame(reader)
+            # 한 연결에서 여러 요청이 동시에 올 수 있으므로 요청마다 태스크로 처리한다
+            task = asyncio.create_task(respond(message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+
+async def serve(socket_path: str, warmup: bool):
+    # 사이드카 쪽에서는 캐시를 쓰지 않는다. 캐시는 API 워커의 엔진이 먼저 확인한다.
+    engine = SummaryEngine(summary_backend, SUMMARY_MAX_BATCH_SIZE, SUMMARY_MAX_WAIT_MS)
+    await engine.preload(warmup)
+
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = await asyncio.start_unix_server(
+        lambda r, w: handle_connection(engine, r, w), path=socket_path
+    )
+    os.chmod(socket_path, 0o660)
+    print(f"[summary-sidecar] listening on {socket_path} (ready={engine.ready})")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await engine.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 모델 사이드카 서버")
+    parser.add_argument("--socket", default=os.getenv("SUMMARY_SIDECAR_SOCKET", "/tmp/community-summary.sock"))
+    parser.add_argument("--no-warmup", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(serve(args.socket, SUMMARY_WARMUP and not args.no_warmup))
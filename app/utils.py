@@ -1,6 +1,8 @@
 import re
+import time
 from passlib.context import CryptContext
 from fastapi.concurrency import run_in_threadpool
+from app.metrics import BCRYPT_WAIT, BCRYPT_DURATION
 
 def email_is_valid(email: str):
     pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
@@ -28,8 +30,22 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # def verify_password(plain_password: str, hashed_password: str) -> bool:
 #     return pwd_context.verify(plain_password, hashed_password)
 
+def _timed(fn, *args):
+    # 스레드풀 안에서 실제로 시작한 시각과 끝난 시각을 같이 돌려준다
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, started, time.perf_counter()
+
+async def _run_bcrypt(op: str, fn, *args):
+    # 메트릭은 이벤트 루프로 돌아와서 기록한다
+    queued = time.perf_counter()
+    result, started, finished = await run_in_threadpool(_timed, fn, *args)
+    BCRYPT_WAIT.observe(started - queued)
+    BCRYPT_DURATION.observe(finished - started, op)
+    return result
+
 async def hash_password_async(password: str) -> str:
-    return await run_in_threadpool(pwd_context.hash, password)
+    return await _run_bcrypt("hash", pwd_context.hash, password)
 
 async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
-    return await run_in_threadpool(pwd_context.verify, plain_password, hashed_password)
\ No newline at end of file
+    return await _run_bcrypt("verify", pwd_context.verify, plain_password, hashed_password)
\ No newline at end of file
@@ -0,0 +1,254 @@
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from datetime import datetime
+
+# API 부하 벤치마크: 앱을 같은 프로세스에 띄우고 httpx ASGI 클라이언트로 엔드포인트별 동시 요청을 보낸다.
+# 기본은 로컬 sqlite(aiosqlite) + 요약 스텁이라 MySQL/모델 없이 돌릴 수 있고,
+# --database-url 로 로컬 MySQL, --summarizer real 로 실제 모델을 쓸 수 있다.
+
+SCENARIOS = ("feed", "detail", "like", "comment", "login", "create")
+PASSWORD = "Bench1234!"
+
+
+class StubSummaryBackend:
+    # 모델 대신 본문 앞부분을 돌려주는 요약 백엔드 (delay 로 생성 시간을 흉내낸다)
+    loaded = True
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def ensure_loaded(self):
+        pass
+
+    def config_key(self) -> str:
+        return f"stub:{self.delay}"
+
+    def generate(self, texts):
+        if self.delay:
+            time.sleep(self.delay)
+        return [t[:60] for t in texts]
+
+    def close(self):
+        pass
+
+
+def percentile(sorted_values, p: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except Exception:
+        return None
+
+
+class Scenario:
+    # 시나리오 하나 = 요청 하나를 만드는 함수. state 는 모든 시나리오가 공유한다
+    def __init__(self, state: dict):
+        self.state = state
+
+    def random_post(self, rng: random.Random) -> int:
+        return rng.randint(1, self.state["max_post_id"])
+
+    async def feed(self, client, user_id, rng):
+        # 대부분은 첫 페이지, 일부는 더 아래로 스크롤
+        if rng.random() < 0.8:
+            return await client.get("/posts", params={"count": 20, "order": "desc"})
+        return await client.get("/posts", params={"count": 20, "before": self.random_post(rng)})
+
+    async def detail(self, client, user_id, rng):
+        return await client.get(f"/posts/{self.random_post(rng)}")
+
+    async def like(self, client, user_id, rng):
+        post_id = self.random_post(rng)
+        if rng.random() < 0.5:
+            return await client.put(f"/posts/{post_id}/like")
+        return await client.delete(f"/posts/{post_id}/like")
+
+    async def comment(self, client, user_id, rng):
+        from seed_data import SENTENCES
+
+        body = {"post_id": self.random_post(rng), "user_id": user_id, "content": rng.choice(SENTENCES)}
+        return await client.post("/comment", json=body)
+
+    async def login(self, client, user_id, rng):
+        return await client.post("/user/login", json={"email": f"seed{user_id}@example.com", "password": PASSWORD})
+
+    async def create(self, client, user_id, rng):
+        from seed_data import make_content
+
+        body = {"user_id": user_id, "title": "벤치마크 새 게시글", "content": make_content(rng)}
+        response = await client.post("/posts", json=body)
+        if response.status_code == 201:
+            self.state["max_post_id"] = max(self.state["max_post_id"], response.json()["data"]["post_id"])
+        return response
+
+
+async def run_scenario(make_request, clients, total: int, warmup: int, rng: random.Random):
+    from app.metrics import HTTP_DB_QUERIES
+
+    async def drive(count: int, latencies: list, statuses: dict):
+        remaining = iter(range(count))
+
+        async def worker(client, user_id, worker_rng):
+            for _ in remaining:
+                started = time.perf_counter()
+                response = await make_request(client, user_id, worker_rng)
+                latencies.append(time.perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        await asyncio.gather(
+            *(worker(client, user_id, random.Random(rng.random())) for client, user_id in clients)
+        )
+
+    await drive(warmup, [], {})
+
+    latencies, statuses = [], {}
+    queries_before = HTTP_DB_QUERIES.totals()
+    started = time.perf_counter()
+    await drive(total, latencies, statuses)
+    wall = time.perf_counter() - started
+    queries_after = HTTP_DB_QUERIES.totals()
+
+    latencies.sort()
+    requests = queries_after[0] - queries_before[0]
+    return {
+        "requests": len(latencies),
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "throughput_rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "queries_per_request": round((queries_after[1] - queries_before[1]) / requests, 2) if requests else 0.0,
+    }
+
+
+async def run(args):
+    import httpx
+    import create_table
+    from app.db import engine
+    from app.main import app, lifespan
+    from app.summary.engine import summary_engine
+
+    if engine.dialect.name != "sqlite" and not args.reset:
+        print("sqlite 가 아닌 DB 는 모든 테이블을 지우고 다시 만든다. 버려도 되는 DB 라면 --reset 을 붙여서 실행")
+        sys.exit(1)
+    await create_table.async_reset_db(engine)
+
+    import seed_data
+
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    seeded = await seed_data.generate(
+        engine, args.users, args.posts, args.comments_per_post, args.likes_per_post, seed=args.seed, password=PASSWORD
+    )
+    print(f"[seed] {seeded} in {time.perf_counter() - started:.1f}s")
+
+    if args.summarizer == "stub":
+        summary_engine.backend = StubSummaryBackend(args.stub_delay_ms / 1000)
+
+    results = {}
+    async with lifespan(app):
+        if args.summarizer == "real":
+            while not summary_engine.ready:
+                await asyncio.sleep(0.5)
+
+        transport = httpx.ASGITransport(app=app)
+        clients = []
+        try:
+            # 동시 사용자마다 클라이언트 하나 (각자 다른 계정으로 로그인해 세션 쿠키를 가진다)
+            for i in range(args.concurrency):
+                user_id = i % args.users + 1
+                client = httpx.AsyncClient(transport=transport, base_url="http://bench")
+                response = await client.post(
+                    "/user/login", json={"email": f"seed{user_id}@example.com", "password": PASSWORD}
+                )
+                response.raise_for_status()
+                clients.append((client, user_id))
+
+            scenario = Scenario({"max_post_id": args.posts})
+            for name in args.scenarios.split(","):
+                # 로그인은 bcrypt 때문에 느려서 요청 수를 따로 정한다
+                total = args.login_requests if name == "login" else args.requests
+                report = await run_scenario(getattr(scenario, name), clients, total, args.warmup, rng)
+                results[name] = report
+                print(
+                    f"[{name:>7}] {report['requests']} req, {report['throughput_rps']} req/s, "
+                    f"p50 {report['p50_ms']}ms, p95 {report['p95_ms']}ms, p99 {report['p99_ms']}ms, "
+                    f"{report['queries_per_request']} queries/req, errors {report['errors']}"
+                )
+        finally:
+            for client, _ in clients:
+                await client.aclose()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "database": engine.dialect.name,
+            "summarizer": args.summarizer if args.summarizer == "real" else f"stub({args.stub_delay_ms}ms)",
+            "seed": args.seed,
+            "seeded": seeded,
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "login_requests": args.login_requests,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 엔드포인트별 지연시간/처리량/요청당 쿼리 수 측정")
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./bench.sqlite")
+    parser.add_argument("--reset", action="store_true", help="sqlite 가 아닌 DB 를 지우고 시드해도 된다는 확인")
+    parser.add_argument("--summarizer", choices=("stub", "real"), default="stub")
+    parser.add_argument("--stub-delay-ms", type=int, default=0, help="요약 스텁의 배치당 생성 시간")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--comments-per-post", type=int, default=5, help="평균 댓글 수")
+    parser.add_argument("--likes-per-post", type=int, default=3, help="평균 좋아요 수")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000, help="시나리오마다 측정할 요청 수")
+    parser.add_argument("--login-requests", type=int, default=100, help="login 시나리오에서 측정할 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="시나리오마다 측정 전에 버릴 요청 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {','.join(sorted(unknown))}")
+
+    # app 모듈은 import 시점에 환경변수를 읽으므로 import 전에 설정한다
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("SESSION_SECRET_KEY", "benchmark")
+    os.environ.setdefault("SUMMARY_PRELOAD", "1" if args.summarizer == "real" else "0")
+
+    report = asyncio.run(run(args))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import json
+import multiprocessing
+import statistics
+import time
+
+SAMPLE_TEXT = (
+    "오늘은 커뮤니티 서비스의 게시글 요약 기능을 점검했다. "
+    "게시글을 작성하면 서버가 본문을 읽고 BART 모델로 짧은 요약을 만든다. "
+    "요약은 게시글 목록에서 카드 아래에 표시되어 사용자가 본문을 열지 않고도 내용을 파악할 수 있다. "
+    "다만 CPU 서버에서는 요약 생성 시간이 길어서 글 작성 응답이 느려지는 문제가 있었다. "
+    "그래서 양자화와 스레드 수 조정, 빔 서치 옵션 조정으로 속도와 품질을 비교해 보기로 했다."
+)
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_mode(args):
+    # 모드마다 새 프로세스에서 실행해야 메모리 사용량이 섞이지 않는다
+    mode, options = args
+    from app.summary.backend import SummaryBackend, MODEL_PATH
+
+    before = rss_mb()
+    backend = SummaryBackend(
+        MODEL_PATH, mode, options["threads"], options["interop_threads"], options["beams"], options["max_length"]
+    )
+    started = time.perf_counter()
+    backend.load()
+    load_sec = time.perf_counter() - started
+    loaded = rss_mb()
+
+    texts = options["texts"]
+    backend.generate(texts[:1])  # warmup
+
+    results = {}
+    for batch_size in options["batch_sizes"]:
+        batch = (texts * batch_size)[:batch_size]
+        latencies = []
+        for _ in range(options["runs"]):
+            t = time.perf_counter()
+            summaries = backend.generate(batch)
+            latencies.append(time.perf_counter() - t)
+        latencies.sort()
+        results[batch_size] = {
+            "p50_ms": round(statistics.median(latencies) * 1000, 1),
+            "max_ms": round(latencies[-1] * 1000, 1),
+            "docs_per_sec": round(batch_size / statistics.median(latencies), 2),
+            "sample": summaries[0],
+        }
+
+    return {
+        "mode": mode,
+        "config": backend.config_key(),
+        "load_sec": round(load_sec, 2),
+        "model_rss_mb": round(loaded - before, 1),
+        "peak_rss_mb": round(rss_mb(), 1),
+        "batches": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요약 모델 추론 모드별 지연시간/메모리 비교")
+    parser.add_argument("--modes", default="fp32,int8")
+    parser.add_argument("--batch-sizes", default="1,4,8")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--interop-threads", type=int, default=0)
+    parser.add_argument("--beams", type=int, default=0)
+    parser.add_argument("--max-length", type=int, default=200)
+    parser.add_argument("--input", help="한 줄에 본문 하나씩 들어 있는 텍스트 파일")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = [SAMPLE_TEXT]
+
+    options = {
+        "threads": args.threads,
+        "interop_threads": args.interop_threads,
+        "beams": args.beams,
+        "max_length": args.max_length,
+        "batch_sizes": [int(b) for b in args.batch_sizes.split(",")],
+        "runs": args.runs,
+        "texts": texts,
+    }
+
+    ctx = multiprocessing.get_context("spawn")
+    reports = []
+    for mode in args.modes.split(","):
+        with ctx.Pool(1) as pool:
+            report = pool.apply(run_mode, ((mode, options),))
+        reports.append(report)
+        print(f"[{report['mode']}] load {report['load_sec']}s, model +{report['model_rss_mb']}MB, peak {report['peak_rss_mb']}MB")
+        for batch_size, r in report["batches"].items():
+            print(f"  batch {batch_size:>3}: p50 {r['p50_ms']}ms, max {r['max_ms']}ms, {r['docs_per_sec']} docs/s")
+        print(f"  sample: {report['batches'][options['batch_sizes'][0]]['sample']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import sys
 import asyncio
 from sqlalchemy.ext.asyncio import AsyncEngine
 from app.db import Base, engine
@@ -5,20 +6,45 @@ from app.entity.user_entity import User
 from app.entity.post_entity import Post
 from app.entity.comment_entity import Comment
 from app.entity.like_entity import Like
+from app.entity.summary_job_entity import SummaryJob
+from app.entity.summary_cache_entity import SummaryCache
+from app.migrations import runner
+
+USAGE = """usage: python create_table.py [upgrade|status|reset]
+  upgrade  적용되지 않은 마이그레이션만 순서대로 적용 (기본값, 데이터 유지)
+  status   현재 스키마 버전과 대기 중인 마이그레이션 출력
+  reset    모든 테이블을 삭제하고 다시 생성 (개발용, 데이터 삭제)"""
 
 async def async_reset_db(async_engine: AsyncEngine):
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    await runner.reset(async_engine)
 
 def sync_reset_db(sync_engine):
-    from sqlalchemy import inspect
-    insp = inspect(sync_engine)
     Base.metadata.drop_all(bind=sync_engine)
     Base.metadata.create_all(bind=sync_engine)
 
+async def upgrade_db(async_engine: AsyncEngine):
+    applied = await runner.upgrade(async_engine)
+    if not applied:
+        print("[migrate] already up to date")
+
+async def print_status(async_engine: AsyncEngine):
+    current = await runner.current_version(async_engine)
+    print(f"current schema version: {current}")
+    for migration in runner.load_migrations():
+        if migration.VERSION > current:
+            print(f"  pending {migration.VERSION:04d} {migration.DESCRIPTION}")
+
 if __name__ == "__main__":
-    if isinstance(engine, AsyncEngine):
-        asyncio.run(async_reset_db(engine))
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "upgrade":
+        asyncio.run(upgrade_db(engine))
+    elif command == "status":
+        asyncio.run(print_status(engine))
+    elif command == "reset":
+        if isinstance(engine, AsyncEngine):
+            asyncio.run(async_reset_db(engine))
+        else:
+            sync_reset_db(engine)
     else:
-        sync_reset_db(engine)
\ No newline at end of file
+        print(USAGE)
+        sys.exit(1)
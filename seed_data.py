@@ -0,0 +1,323 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, func, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.db import engine
+from app.entity.user_entity import User
+from app.entity.post_entity import Post
+from app.entity.comment_entity import Comment
+from app.entity.like_entity import Like
+from app.utils import pwd_context
+import create_table
+
+# 대량 데이터 시드/가져오기 (용량 테스트용).
+# 모델 함수처럼 한 건씩 add + commit 하지 않고, 배치 단위 INSERT 를 여러 커넥션으로 나눠 보낸 뒤
+# 비정규화 컬럼(likes, comments_count, author_nickname)은 마지막에 집합 단위 UPDATE 로 다시 계산한다.
+#
+#   python seed_data.py generate --users 10000 --posts 1000000 --comments-per-post 5 --likes-per-post 10
+#   python seed_data.py import ./dump        # users.jsonl, posts.jsonl, comments.jsonl, likes.jsonl
+
+SENTENCES = (
+    "오늘은 커뮤니티 서비스의 게시글 목록을 점검했다.",
+    "무한 스크롤에서 다음 페이지를 불러올 때 응답 시간이 중요하다.",
+    "좋아요와 댓글 수는 카드마다 함께 보여준다.",
+    "요약은 본문을 열지 않고도 내용을 파악할 수 있게 해준다.",
+    "서버는 FastAPI 와 MySQL 로 구성되어 있다.",
+    "이미지와 함께 올린 게시글은 목록에서 썸네일이 보인다.",
+    "주말에는 게시글 작성이 평일보다 두 배 가까이 많다.",
+    "댓글이 많은 게시글은 상세 페이지 로딩이 느려지기 쉽다.",
+)
+RECOMPUTE_CHUNK = 50_000
+
+
+def make_content(rng: random.Random) -> str:
+    return " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(3, 12)))
+
+
+def _batches(rows, batch_size: int):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _insert_stmt(table):
+    stmt = insert(table)
+    if table is Like:
+        # (post_id, user_id) 유니크 인덱스와 겹치는 행은 건너뛴다
+        stmt = stmt.prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+    return stmt
+
+
+async def insert_stream(async_engine: AsyncEngine, table, rows, batch_size: int, connections: int) -> int:
+    # rows 는 dict 를 하나씩 내주는 이터레이터. 배치로 묶어서 connections 개의 커넥션이 나눠 INSERT 한다.
+    # executemany 로 보내므로 asyncmy 는 배치 하나를 여러 행 INSERT ... VALUES (...), (...) 문장으로 보낸다.
+    if async_engine.dialect.name == "sqlite":
+        connections = 1  # sqlite 는 쓰기 커넥션이 하나뿐이라 나눠도 잠금만 기다린다
+    queue: asyncio.Queue = asyncio.Queue(maxsize=connections * 2)
+    stmt = _insert_stmt(table)
+    inserted = 0
+
+    async def writer():
+        nonlocal inserted
+        async with async_engine.connect() as conn:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                result = await conn.execute(stmt, batch)
+                await conn.commit()
+                # IGNORE 로 건너뛴 행은 빼고 센다 (드라이버가 모르면 보낸 행 수)
+                inserted += result.rowcount if result.rowcount >= 0 else len(batch)
+
+    writers = [asyncio.create_task(writer()) for _ in range(connections)]
+    try:
+        for batch in _batches(rows, batch_size):
+            # 쓰기 쪽이 먼저 죽으면 큐가 비워지지 않으므로 확인하고 넣는다
+            for w in writers:
+                if w.done():
+                    w.result()
+            await queue.put(batch)
+        for _ in writers:
+            await queue.put(None)
+        await asyncio.gather(*writers)
+    except BaseException:
+        for w in writers:
+            w.cancel()
+        raise
+    return inserted
+
+
+async def _max_id(async_engine: AsyncEngine, column) -> int:
+    async with async_engine.connect() as conn:
+        return (await conn.execute(select(func.max(column)))).scalar() or 0
+
+
+async def _user_ids(async_engine: AsyncEngine) -> list[int]:
+    async with async_engine.connect() as conn:
+        return list((await conn.execute(select(User.user_id))).scalars())
+
+
+async def generate(
+    async_engine: AsyncEngine,
+    users: int,
+    posts: int,
+    comments_per_post: int,
+    likes_per_post: int,
+    batch_size: int = 5000,
+    connections: int = 4,
+    seed: int = 42,
+    password: str = "Seed1234!",
+) -> dict:
+    # 이미 있는 데이터 뒤에 이어서 만든다. 댓글/좋아요는 이번에 만든 게시글에만 단다.
+    rng = random.Random(seed)
+    counts = {}
+
+    first_user = await _max_id(async_engine, User.user_id) + 1
+    # bcrypt 는 느리므로 생성한 사용자는 모두 같은 해시를 쓴다
+    password_hash = pwd_context.hash(password)
+    counts["users"] = await insert_stream(
+        async_engine,
+        User,
+        (
+            {"user_id": i, "email": f"seed{i}@example.com", "nickname": f"seed{i}", "password": password_hash}
+            for i in range(first_user, first_user + users)
+        ),
+        batch_size,
+        connections,
+    )
+
+    user_ids = await _user_ids(async_engine)
+    if posts and not user_ids:
+        raise SystemExit("게시글을 만들려면 사용자가 한 명 이상 있어야 한다 (--users)")
+
+    first_post = await _max_id(async_engine, Post.post_id) + 1
+    started = datetime.now() - timedelta(minutes=posts)
+
+    def created_at(post_id: int) -> datetime:
+        return started + timedelta(minutes=post_id - first_post)
+
+    def post_rows():
+        for post_id in range(first_post, first_post + posts):
+            content = make_content(rng)
+            yield {
+                "post_id": post_id,
+                "user_id": rng.choice(user_ids),
+                "title": f"시드 게시글 {post_id}",
+                "content": content,
+                "summary": content[:60],
+                "summary_status": "done",
+                "author_nickname": "",  # 아래 recompute 에서 채운다
+                "created_at": created_at(post_id),
+                "views": rng.randint(0, 500),
+            }
+
+    counts["posts"] = await insert_stream(async_engine, Post, post_rows(), batch_size, connections)
+
+    def comment_rows():
+        for post_id in range(first_post, first_post + posts):
+            base = created_at(post_id)
+            for n in range(rng.randint(0, comments_per_post * 2)):
+                yield {
+                    "post_id": post_id,
+                    "user_id": rng.choice(user_ids),
+                    "content": rng.choice(SENTENCES),
+                    "created_at": base + timedelta(seconds=n + 1),
+                }
+
+    def like_rows():
+        for post_id in range(first_post, first_post + posts):
+            k = min(len(user_ids), rng.randint(0, likes_per_post * 2))
+            for user_id in rng.sample(user_ids, k):
+                yield {"post_id": post_id, "user_id": user_id}
+
+    counts["comments"] = await insert_stream(async_engine, Comment, comment_rows(), batch_size, connections)
+    counts["likes"] = await insert_stream(async_engine, Like, like_rows(), batch_size, connections)
+
+    await recompute_counters(async_engine, first_post)
+    return counts
+
+
+def _read_jsonl(path: str, table):
+    # 테이블에 없는 키는 버리고, 날짜 문자열은 datetime 으로 바꾼다
+    columns = {c.name: c for c in table.__table__.columns}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            raw = json.loads(line)
+            row = {k: v for k, v in raw.items() if k in columns}
+            for key in ("created_at", "updated_at"):
+                if isinstance(row.get(key), str):
+                    row[key] = datetime.fromisoformat(row[key])
+            if table is Post:
+                row.setdefault("author_nickname", "")
+            yield row
+
+
+async def import_dir(async_engine: AsyncEngine, directory: str, batch_size: int = 5000, connections: int = 4) -> dict:
+    counts = {}
+    # 카운터를 다시 계산할 시작 post_id. 새로 붙는 게시글은 first_post 부터,
+    # 기존 게시글에 붙는 댓글/좋아요나 명시적 post_id 는 가져온 행에서 본 가장 작은 post_id 부터
+    recompute_from = first_post = await _max_id(async_engine, Post.post_id) + 1
+
+    def track_post_ids(rows):
+        nonlocal recompute_from
+        for row in rows:
+            post_id = row.get("post_id")
+            if post_id is not None and post_id < recompute_from:
+                recompute_from = post_id
+            yield row
+
+    for name, table in (("users", User), ("posts", Post), ("comments", Comment), ("likes", Like)):
+        path = os.path.join(directory, f"{name}.jsonl")
+        if os.path.exists(path):
+            rows = _read_jsonl(path, table)
+            if table is not User:
+                rows = track_post_ids(rows)
+            counts[name] = await insert_stream(async_engine, table, rows, batch_size, connections)
+    # 사용자를 가져왔으면 기존 게시글의 author_nickname 도 바뀔 수 있으므로 전체를 다시 계산한다
+    if counts.get("users"):
+        recompute_from = 1
+    await recompute_counters(async_engine, max(1, recompute_from))
+    return counts
+
+
+async def recompute_counters(async_engine: AsyncEngine, from_post_id: int = 1):
+    # likes / comments_count / author_nickname 을 실제 행에서 다시 계산한다.
+    # post_id 구간별로 나눠서 트랜잭션 하나가 너무 커지지 않게 한다 (updated_at 은 건드리지 않는다).
+    if async_engine.dialect.name == "mysql":
+        stmt = text(
+            """
+            UPDATE posts p
+            JOIN users u ON u.user_id = p.user_id
+            LEFT JOIN (SELECT post_id, COUNT(*) AS n FROM likes
+                       WHERE post_id >= :lo AND post_id < :hi GROUP BY post_id) l ON l.post_id = p.post_id
+            LEFT JOIN (SELECT post_id, COUNT(*) AS n FROM comments
+                       WHERE post_id >= :lo AND post_id < :hi GROUP BY post_id) c ON c.post_id = p.post_id
+            SET p.likes = COALESCE(l.n, 0),
+                p.comments_count = COALESCE(c.n, 0),
+                p.author_nickname = u.nickname
+            WHERE p.post_id >= :lo AND p.post_id < :hi
+            """
+        )
+    else:
+        stmt = text(
+            """
+            UPDATE posts SET
+                likes = (SELECT COUNT(*) FROM likes WHERE likes.post_id = posts.post_id),
+                comments_count = (SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.post_id),
+                author_nickname = (SELECT nickname FROM users WHERE users.user_id = posts.user_id)
+            WHERE post_id >= :lo AND post_id < :hi
+            """
+        )
+    last = await _max_id(async_engine, Post.post_id)
+    for lo in range(from_post_id, last + 1, RECOMPUTE_CHUNK):
+        async with async_engine.begin() as conn:
+            await conn.execute(stmt, {"lo": lo, "hi": lo + RECOMPUTE_CHUNK})
+
+
+async def main(args):
+    try:
+        if args.reset:
+            await create_table.async_reset_db(engine)
+        else:
+            await create_table.upgrade_db(engine)
+
+        started = time.perf_counter()
+        if args.command == "generate":
+            counts = await generate(
+                engine,
+                args.users,
+                args.posts,
+                args.comments_per_post,
+                args.likes_per_post,
+                args.batch_size,
+                args.connections,
+                args.seed,
+                args.password,
+            )
+        else:
+            counts = await import_dir(engine, args.directory, args.batch_size, args.connections)
+        elapsed = time.perf_counter() - started
+        print(f"[seed] {counts} in {elapsed:.1f}s ({sum(counts.values()) / elapsed:.0f} rows/s)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대량 데이터 시드 / 가져오기")
+    parser.add_argument("--batch-size", type=int, default=5000, help="INSERT 한 번에 보내는 행 수")
+    parser.add_argument("--connections", type=int, default=4, help="동시에 INSERT 하는 커넥션 수 (sqlite 는 1)")
+    parser.add_argument("--reset", action="store_true", help="모든 테이블을 지우고 시작 (데이터 삭제)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="임의 데이터 생성")
+    gen.add_argument("--users", type=int, default=1000)
+    gen.add_argument("--posts", type=int, default=100_000)
+    gen.add_argument("--comments-per-post", type=int, default=5, help="평균 댓글 수")
+    gen.add_argument("--likes-per-post", type=int, default=5, help="평균 좋아요 수")
+    gen.add_argument("--seed", type=int, default=42)
+    gen.add_argument("--password", default="Seed1234!", help="생성한 사용자들의 비밀번호")
+
+    imp = sub.add_parser("import", help="JSONL 파일 가져오기 (users/posts/comments/likes.jsonl)")
+    imp.add_argument("directory")
+
+    args = parser.parse_args()
+    if args.batch_size <= 0 or args.connections <= 0:
+        parser.error("--batch-size and --connections must be positive")
+    if args.command == "import" and not os.path.isdir(args.directory):
+        print(f"not a directory: {args.directory}")
+        sys.exit(1)
+    asyncio.run(main(args))